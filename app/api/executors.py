@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+_SIM_POOL: ProcessPoolExecutor | None = None
+
+
+def simulation_pool() -> ProcessPoolExecutor:
+    """Return the shared worker pool for CPU-bound game and season simulations."""
+
+    # Simulations are pure-Python CPU work, so they run in worker processes
+    # rather than the threadpool to escape the GIL. "spawn" keeps children
+    # from inheriting the server's threads and open database handles.
+    global _SIM_POOL
+    if _SIM_POOL is None:
+        _SIM_POOL = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _SIM_POOL
+
+
+def shutdown_simulation_pool() -> None:
+    """Stop the simulation worker processes, if any were started."""
+
+    global _SIM_POOL
+    if _SIM_POOL is not None:
+        _SIM_POOL.shutdown(wait=True, cancel_futures=True)
+        _SIM_POOL = None
@@ -1,33 +1,36 @@
 from __future__ import annotations
 
+import asyncio
 import base64
-import json
-import zlib
-from dataclasses import asdict
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any, Dict
 from uuid import uuid4
 
+import orjson
+import zstandard as zstd
 from fastapi import APIRouter, Depends, HTTPException, status
-
-try:
-    import orjson
-except ImportError:  # pragma: no cover - optional dependency
-    orjson = None
 from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
+from sqlalchemy import insert
 from sqlmodel import Session, select
 
 from app.api.deps import db_session
+from app.api.executors import simulation_pool
+from app.api.orjson_response import ORJSONResponse
+from app.api.rosters import attributes_from_payload
 from domain.db import BoxScoreRow, GameRow, PlayerRow, TeamRow
-from domain.gameplan import GameplanRepository
-from domain.models import Attributes, Player
-from sim.ruleset import GameConfig, GameSummary, simulate_game
+from domain.gameplan import GameplanRepository, WeeklyGameplan
+from domain.models import Player
+from sim.ruleset import DriveSummary, GameConfig, GameSummary, simulate_game
 from sim.statbook import StatBook
 
 DEFAULT_USER_HOME = Path.home() / "GridironSim"
 
-router = APIRouter(prefix="/game", tags=["game"])
+# Events blobs are zstd frames; clients decode with base64 + zstd decompress.
+_EVENTS_COMPRESSOR = zstd.ZstdCompressor(level=3)
+
+router = APIRouter(prefix="/game", tags=["game"], default_response_class=ORJSONResponse)
 
 
 class GameConfigPayload(BaseModel):
@@ -47,17 +50,6 @@ class GameSimulationRequest(BaseModel):
     config: GameConfigPayload | None = None
 
 
-class DriveSummaryPayload(BaseModel):
-    offense: str
-    quarter: int
-    plays: int
-    yards: float
-    duration: float
-    start_yardline: float
-    end_yardline: float
-    result: str
-
-
 class GameSimulationResponse(BaseModel):
     game_id: str | None
     home_team: str
@@ -66,54 +58,40 @@ class GameSimulationResponse(BaseModel):
     away_score: int
     winner: str | None
     total_plays: int
-    drives: list[DriveSummaryPayload]
+    drives: list[DriveSummary]
     boxscore: Dict[str, Any]
-    events_blob: str | None = None
+    events_blob: str | None = Field(
+        default=None,
+        description="Base64-encoded, zstd-compressed JSON of home/away play events",
+    )
     gameplan_results: Dict[str, Any] | None = None
 
 
 def _encode_events(summary: GameSummary) -> str | None:
     if not summary.home_events and not summary.away_events:
         return None
-    payload = {
-        "home": [asdict(evt) for evt in summary.home_events],
-        "away": [asdict(evt) for evt in summary.away_events],
-    }
-    if orjson is not None:
-        raw = orjson.dumps(payload)
-    else:
-        raw = json.dumps(payload).encode("utf-8")
-    compressed = zlib.compress(raw, level=9)
+    # orjson walks the PlayEvent dataclasses natively, so no per-event dicts.
+    raw = orjson.dumps({"home": summary.home_events, "away": summary.away_events})
+    compressed = _EVENTS_COMPRESSOR.compress(raw)
     return base64.b64encode(compressed).decode("ascii")
 
 
-def _attributes_from_payload(payload: dict[str, int] | None) -> Attributes:
-    base = {
-        "speed": 60,
-        "strength": 60,
-        "agility": 60,
-        "awareness": 60,
-        "catching": 60,
-        "tackling": 60,
-        "throwing_power": 60,
-        "accuracy": 60,
-    }
-    if payload:
-        base.update({key: int(value) for key, value in payload.items()})
-    return Attributes(**base)
-
-
-def _roster(session: Session, team_id: str) -> Dict[str, Player]:
-    team = session.get(TeamRow, team_id)
-    if not team:
-        raise HTTPException(status_code=404, detail=f"Team '{team_id}' not found")
-    players = session.exec(select(PlayerRow).where(PlayerRow.team_id == team_id)).all()
-    if not players:
-        raise HTTPException(status_code=400, detail=f"Team '{team_id}' has no players")
-    roster: Dict[str, Player] = {}
-    for row in players:
-        attrs = _attributes_from_payload(row.attributes or {})
-        roster[row.player_id] = Player(
+def _require_teams(session: Session, team_ids: tuple[str, ...]) -> None:
+    known = set(session.exec(select(TeamRow.team_id).where(TeamRow.team_id.in_(team_ids))).all())
+    for team_id in team_ids:
+        if team_id not in known:
+            raise HTTPException(status_code=404, detail=f"Team '{team_id}' not found")
+
+
+def _rosters(
+    session: Session, home_team_id: str, away_team_id: str
+) -> tuple[Dict[str, Player], Dict[str, Player]]:
+    team_ids = (home_team_id, away_team_id)
+    rows = session.exec(select(PlayerRow).where(PlayerRow.team_id.in_(team_ids))).all()
+    rosters: Dict[str, Dict[str, Player]] = {team_id: {} for team_id in team_ids}
+    for row in rows:
+        attrs = attributes_from_payload(row.attributes or {})
+        rosters[row.team_id][row.player_id] = Player(
             player_id=row.player_id,
             name=row.name,
             position=row.position.value,
@@ -121,24 +99,66 @@ def _roster(session: Session, team_id: str) -> Dict[str, Player]:
             attributes=attrs,
             team_id=row.team_id,
         )
-    return roster
+    for team_id in team_ids:
+        if not rosters[team_id]:
+            raise HTTPException(status_code=400, detail=f"Team '{team_id}' has no players")
+    return rosters[home_team_id], rosters[away_team_id]
+
+
+@lru_cache(maxsize=1)
+def _gameplan_repository() -> GameplanRepository:
+    return GameplanRepository(DEFAULT_USER_HOME)
+
+
+def _load_plans(home_team_id: str, away_team_id: str, week: int) -> tuple[WeeklyGameplan, WeeklyGameplan]:
+    # Both plans load on one worker thread: GameplanRepository may persist a
+    # generated default plan and is not safe to drive from two threads. The
+    # repository reloads when gameplans.json or its journal change on disk,
+    # and every load decodes a fresh plan, so nothing mutable is shared.
+    repository = _gameplan_repository()
+    return (
+        repository.load_plan(home_team_id, opponent_id=away_team_id, week=week),
+        repository.load_plan(away_team_id, opponent_id=home_team_id, week=week),
+    )
+
+
+_CONFIG_FIELDS = ("quarter_length", "quarters", "max_plays", "kickoff_yardline")
 
 
 def _build_config(payload: GameConfigPayload | None) -> GameConfig | None:
     if not payload:
         return None
-    config_kwargs = {}
-    if payload.quarter_length is not None:
-        config_kwargs["quarter_length"] = payload.quarter_length
-    if payload.quarters is not None:
-        config_kwargs["quarters"] = payload.quarters
-    if payload.max_plays is not None:
-        config_kwargs["max_plays"] = payload.max_plays
-    if payload.kickoff_yardline is not None:
-        config_kwargs["kickoff_yardline"] = payload.kickoff_yardline
+    config_kwargs = {
+        name: value
+        for name in _CONFIG_FIELDS
+        if (value := getattr(payload, name)) is not None
+    }
     return GameConfig(**config_kwargs) if config_kwargs else None
 
 
+def _boxscore_mappings(game_id: str, team_id: str, boxscore: Dict[str, Any]) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = [
+        {
+            "game_id": game_id,
+            "team_id": team_id,
+            "player_id": None,
+            "stat_type": "team_game",
+            "stat_payload": boxscore.get("teams", {}),
+        }
+    ]
+    rows.extend(
+        {
+            "game_id": game_id,
+            "team_id": team_id,
+            "player_id": player_id,
+            "stat_type": "player_game",
+            "stat_payload": stats,
+        }
+        for player_id, stats in boxscore.get("players", {}).items()
+    )
+    return rows
+
+
 def _persist_game(
     session: Session,
     summary: GameSummary,
@@ -155,68 +175,56 @@ def _persist_game(
             played=True,
         )
     )
-    session.add(
-        BoxScoreRow(
-            game_id=game_id,
-            team_id=summary.home_team,
-            player_id=None,
-            stat_type="team_game",
-            stat_payload=summary.home_boxscore.get("teams", {}),
-        )
-    )
-    for player_id, stats in summary.home_boxscore.get("players", {}).items():
-        session.add(
-            BoxScoreRow(
-                game_id=game_id,
-                team_id=summary.home_team,
-                player_id=player_id,
-                stat_type="player_game",
-                stat_payload=stats,
-            )
-        )
-    session.add(
-        BoxScoreRow(
-            game_id=game_id,
-            team_id=summary.away_team,
-            player_id=None,
-            stat_type="team_game",
-            stat_payload=summary.away_boxscore.get("teams", {}),
-        )
-    )
-    for player_id, stats in summary.away_boxscore.get("players", {}).items():
-        session.add(
-            BoxScoreRow(
-                game_id=game_id,
-                team_id=summary.away_team,
-                player_id=player_id,
-                stat_type="player_game",
-                stat_payload=stats,
-            )
-        )
+    rows = _boxscore_mappings(game_id, summary.home_team, summary.home_boxscore)
+    rows.extend(_boxscore_mappings(game_id, summary.away_team, summary.away_boxscore))
+    # One executemany INSERT for every box-score row; autoflush writes the
+    # GameRow above first.
+    session.execute(insert(BoxScoreRow), rows)
+    return game_id
+
+
+def _save_game(session: Session, summary: GameSummary, request: GameSimulationRequest) -> str:
+    game_id = _persist_game(session, summary, request)
+    session.commit()
     return game_id
 
 
-@router.post("/simulate", response_model=GameSimulationResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/simulate",
+    response_model=GameSimulationResponse,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+)
 async def simulate_game_endpoint(
     payload: GameSimulationRequest,
     session: Session = Depends(db_session),
-) -> GameSimulationResponse:
+) -> ORJSONResponse:
     if payload.home_team_id == payload.away_team_id:
         raise HTTPException(status_code=400, detail="Home and away teams must differ")
 
-    home_roster = _roster(session, payload.home_team_id)
-    away_roster = _roster(session, payload.away_team_id)
-
-    config = _build_config(payload.config)
+    # The session is synchronous, so its queries and commit run on the
+    # threadpool rather than stalling the event loop. Both teams are checked
+    # before any gameplan work starts, since loading a missing plan generates
+    # and saves a default; the plans then come off disk concurrently with the
+    # roster load.
+    await run_in_threadpool(_require_teams, session, (payload.home_team_id, payload.away_team_id))
+    plans = asyncio.ensure_future(
+        run_in_threadpool(_load_plans, payload.home_team_id, payload.away_team_id, payload.week)
+    )
+    try:
+        home_roster, away_roster = await run_in_threadpool(
+            _rosters, session, payload.home_team_id, payload.away_team_id
+        )
+        config = _build_config(payload.config)
+    except BaseException:
+        plans.cancel()
+        raise
     home_book = StatBook()
     away_book = StatBook()
+    home_plan, away_plan = await plans
 
-
-    repo = GameplanRepository(DEFAULT_USER_HOME)
-    home_plan = repo.load_plan(payload.home_team_id, opponent_id=payload.away_team_id, week=payload.week)
-    away_plan = repo.load_plan(payload.away_team_id, opponent_id=payload.home_team_id, week=payload.week)
-
-    summary = await run_in_threadpool(
+    loop = asyncio.get_running_loop()
+    run = partial(
         simulate_game,
         payload.home_team_id,
         home_roster,
@@ -230,27 +238,29 @@ async def simulate_game_endpoint(
         home_plan=home_plan,
         away_plan=away_plan,
     )
+    summary = await loop.run_in_executor(simulation_pool(), run)
 
     game_id: str | None = None
     if payload.save:
-        game_id = _persist_game(session, summary, payload)
-        session.commit()
-
-    events_blob = _encode_events(summary)
-    drives = [DriveSummaryPayload(**asdict(drive)) for drive in summary.drives]
-    return GameSimulationResponse(
-        game_id=game_id,
-        home_team=summary.home_team,
-        away_team=summary.away_team,
-        home_score=summary.home_score,
-        away_score=summary.away_score,
-        winner=summary.winner,
-        total_plays=summary.total_plays,
-        drives=drives,
-        boxscore={
+        game_id = await run_in_threadpool(_save_game, session, summary, payload)
+
+    # The summary is already well-formed, so hand it straight to orjson (which
+    # serializes the drive dataclasses natively) instead of re-validating it
+    # through GameSimulationResponse and jsonable_encoder.
+    body = {
+        "game_id": game_id,
+        "home_team": summary.home_team,
+        "away_team": summary.away_team,
+        "home_score": summary.home_score,
+        "away_score": summary.away_score,
+        "winner": summary.winner,
+        "total_plays": summary.total_plays,
+        "drives": summary.drives,
+        "boxscore": {
             "home": summary.home_boxscore,
             "away": summary.away_boxscore,
         },
-        events_blob=events_blob,
-        gameplan_results=summary.gameplan_results if summary.gameplan_results else None,
-    )
+        "events_blob": _encode_events(summary),
+        "gameplan_results": summary.gameplan_results if summary.gameplan_results else None,
+    }
+    return ORJSONResponse(body, status_code=status.HTTP_201_CREATED)
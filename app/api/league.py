@@ -7,10 +7,11 @@ from fastapi import APIRouter, HTTPException, status
 from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
+from app.api.orjson_response import ORJSONResponse
 from scripts.seed_league import DEFAULT_SEED, SeedSummary, seed_league
 from domain.savepoint import create_savepoint
 
-router = APIRouter(prefix="/league", tags=["league"])
+router = APIRouter(prefix="/league", tags=["league"], default_response_class=ORJSONResponse)
 
 
 class LeagueCreateRequest(BaseModel):
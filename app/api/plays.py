@@ -1,20 +1,23 @@
 from __future__ import annotations
 
-from typing import Any
+from functools import lru_cache
+from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, status
 from pydantic import BaseModel, ValidationError
 
+from app.api.orjson_response import ORJSONResponse
 from domain.models import Play
 from domain.playbook import (
     PlayAlreadyExistsError,
     PlayValidationError,
     PlaybookError,
     PlaybookRepository,
+    sanitize_error_context,
     validate_play as domain_validate_play,
 )
 
-router = APIRouter(prefix="/play", tags=["plays"])
+router = APIRouter(prefix="/play", tags=["plays"], default_response_class=ORJSONResponse)
 
 
 class PlayValidationResponse(BaseModel):
@@ -35,24 +38,18 @@ class PlayImportResponse(BaseModel):
     path: str
 
 
-def _sanitize_error_context(errors: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    sanitized: list[dict[str, Any]] = []
-    for error in errors:
-        ctx = error.get("ctx")
-        if isinstance(ctx, dict):
-            error = {**error, "ctx": {key: str(value) for key, value in ctx.items()}}
-        sanitized.append(error)
-    return sanitized
+DEFAULT_PLAYS_DIR = Path("data/plays")
 
 
+@lru_cache(maxsize=1)
 def _repository() -> PlaybookRepository:
-    return PlaybookRepository()
+    return PlaybookRepository(DEFAULT_PLAYS_DIR)
 
 
 @router.get("/list", response_model=list[PlaySummary])
 async def list_plays() -> list[PlaySummary]:
-    repo = _repository()
-    summaries = repo.list_plays()
+    # The shared repository only re-parses play files whose mtime or size changed.
+    summaries = _repository().list_plays()
     return [
         PlaySummary(
             play_id=item.play_id,
@@ -85,14 +82,26 @@ async def import_play(play: Play, overwrite: bool = Query(False, description="Ov
     return PlayImportResponse(play_id=play.play_id, path=str(path))
 
 
-@router.post("/validate", response_model=PlayValidationResponse)
-async def validate_play(payload: dict[str, Any]) -> PlayValidationResponse:
+@router.post(
+    "/validate",
+    response_model=PlayValidationResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"type": "object"}}},
+        }
+    },
+)
+async def validate_play(request: Request) -> PlayValidationResponse:
+    # Parse and validate the raw body in one pass instead of letting FastAPI
+    # decode it to a dict that Play.model_validate would walk again.
+    raw = await request.body()
     try:
-        play = Play.model_validate(payload)
+        play = Play.model_validate_json(raw)
     except ValidationError as exc:
         raise HTTPException(
             status_code=400,
-            detail=_sanitize_error_context(exc.errors()),
+            detail=sanitize_error_context(exc.errors()),
         ) from exc
 
     errors = domain_validate_play(play)
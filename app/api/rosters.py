@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from domain.models import Attributes
+
+_DEFAULT_ATTRIBUTES: dict[str, int] = {
+    "speed": 60,
+    "strength": 60,
+    "agility": 60,
+    "awareness": 60,
+    "catching": 60,
+    "tackling": 60,
+    "throwing_power": 60,
+    "accuracy": 60,
+}
+# Attributes are never mutated after construction, so players with identical
+# ratings (including players without stored ratings) share one instance.
+_DEFAULT_ATTRIBUTES_MODEL = Attributes(**_DEFAULT_ATTRIBUTES)
+
+
+@lru_cache(maxsize=4096)
+def _cached_attributes(ratings: tuple[tuple[str, int], ...]) -> Attributes:
+    merged = dict(_DEFAULT_ATTRIBUTES)
+    merged.update(ratings)
+    return Attributes(**merged)
+
+
+def attributes_from_payload(payload: dict[str, int] | None) -> Attributes:
+    """Build validated attributes from a stored PlayerRow payload, filling in defaults."""
+
+    if not payload:
+        return _DEFAULT_ATTRIBUTES_MODEL
+    return _cached_attributes(tuple(sorted((key, int(value)) for key, value in payload.items())))
@@ -1,25 +1,35 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from concurrent.futures import Future
 from dataclasses import dataclass
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Deque, Dict, Iterable, Iterator, List, Tuple
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.concurrency import run_in_threadpool
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from pydantic import BaseModel, Field
+from sqlalchemy import insert
 from sqlmodel import Session, select
 
 from app.api.deps import db_session
+from app.api.executors import simulation_pool
+from app.api.rosters import attributes_from_payload
 from domain.db import BoxScoreRow, GameRow, PlayerRow, SeasonRow, TeamRow
 from domain.gameplan import GameplanRepository
 from domain.savepoint import create_savepoint
 from sim.exports import export_draft_results, export_injuries, export_player_stats, export_standings, export_team_stats
-from domain.models import Attributes, Player
+from domain.models import Player
 from sim.schedule import SeasonResult, make_schedule, simulate_season
+from sim.ruleset import GameSummary
 
 DEFAULT_USER_HOME = Path.home() / "GridironSim"
+DEFAULT_EXPORTS_ROOT = Path("data/exports")
+
+_STMT_TEAMS = select(TeamRow)
+_STMT_ROSTERED_PLAYERS = select(PlayerRow).where(PlayerRow.team_id.is_not(None)).order_by(PlayerRow.team_id)
 
 router = APIRouter(prefix="/season", tags=["season"])
 
@@ -27,7 +37,7 @@ router = APIRouter(prefix="/season", tags=["season"])
 class SeasonRunRequest(BaseModel):
     seed: int = Field(default=0, description="Base random seed for simulations")
     seasons: int = Field(default=1, ge=1, le=10, description="Number of seasons to simulate")
-    workers: int = Field(default=1, ge=1, le=4, description="Parallel worker threads to use")
+    workers: int = Field(default=1, ge=1, le=4, description="Parallel worker processes to use")
     starting_year: int | None = Field(default=None, description="Optional starting year for generated seasons")
     description: str | None = Field(default=None, description="Optional description applied to each season row")
 
@@ -59,63 +69,72 @@ class SeasonRunResponse(BaseModel):
     seasons: List[SeasonRunSummary]
 
 
-@dataclass
+@dataclass(slots=True)
 class _SimPayload:
     seed: int
     schedule: List[Tuple[int, str, str]]
     result: SeasonResult
 
 
-def _attributes_from_payload(payload: dict[str, int] | None) -> Attributes:
-    base = {
-        "speed": 60,
-        "strength": 60,
-        "agility": 60,
-        "awareness": 60,
-        "catching": 60,
-        "tackling": 60,
-        "throwing_power": 60,
-        "accuracy": 60,
-    }
-    if payload:
-        base.update({key: int(value) for key, value in payload.items()})
-    return Attributes(**base)
-
-
 def _players_by_team(session: Session) -> Dict[str, List[PlayerRow]]:
-    players = session.exec(select(PlayerRow)).all()
-    mapping: Dict[str, List[PlayerRow]] = {}
-    for player in players:
-        team_id = player.team_id
-        if not team_id:
-            continue
-        mapping.setdefault(team_id, []).append(player)
-    return mapping
+    rows = session.exec(_STMT_ROSTERED_PLAYERS).all()
+    return {team_id: list(group) for team_id, group in groupby(rows, key=attrgetter("team_id")) if team_id}
 
 
 def _roster_for_team(team_id: str, rows: Iterable[PlayerRow]) -> Dict[str, Player]:
-    roster: Dict[str, Player] = {}
-    for row in rows:
-        attrs = _attributes_from_payload(row.attributes or {})
-        roster[row.player_id] = Player(
+    return {
+        row.player_id: Player(
             player_id=row.player_id,
             name=row.name,
             position=row.position.value,
             jersey_number=row.jersey_number,
-            attributes=attrs,
+            attributes=attributes_from_payload(row.attributes),
             team_id=row.team_id,
         )
-    return roster
+        for row in rows
+    }
 
 
 def _build_rosters(teams: List[TeamRow], players: Dict[str, List[PlayerRow]]) -> Dict[str, Dict[str, Player]]:
-    rosters: Dict[str, Dict[str, Player]] = {}
-    for team in teams:
-        team_players = players.get(team.team_id, [])
-        if not team_players:
-            continue
-        rosters[team.team_id] = _roster_for_team(team.team_id, team_players)
-    return rosters
+    return {
+        team.team_id: _roster_for_team(team.team_id, team_players)
+        for team in teams
+        if (team_players := players.get(team.team_id))
+    }
+
+
+def _insert_rows(
+    session: Session,
+    game_rows: List[Dict[str, object]],
+    box_rows: List[Dict[str, object]],
+) -> None:
+    """Write buffered game and box-score mappings with executemany inserts, then reset the buffers."""
+
+    if game_rows:
+        session.execute(insert(GameRow), game_rows)
+        game_rows.clear()
+    if box_rows:
+        session.execute(insert(BoxScoreRow), box_rows)
+        box_rows.clear()
+
+
+def _iter_box_rows(game_id: str, home_team: str, away_team: str, summary: GameSummary) -> Iterator[Dict[str, object]]:
+    for team_id, boxscore in ((home_team, summary.home_boxscore), (away_team, summary.away_boxscore)):
+        yield {
+            "game_id": game_id,
+            "team_id": team_id,
+            "player_id": None,
+            "stat_type": "team_game",
+            "stat_payload": boxscore.get("teams", {}),
+        }
+        for player_id, stats in boxscore.get("players", {}).items():
+            yield {
+                "game_id": game_id,
+                "team_id": team_id,
+                "player_id": player_id,
+                "stat_type": "player_game",
+                "stat_payload": stats,
+            }
 
 
 def _persist_season(
@@ -128,60 +147,28 @@ def _persist_season(
 ) -> List[GameResultEntry]:
     session.add(season_row)
     games_payload: List[GameResultEntry] = []
+    game_rows: List[Dict[str, object]] = []
+    box_rows: List[Dict[str, object]] = []
     total_games = len(result.game_results)
     midpoint = total_games // 2 if total_games > 1 else 0
     mid_save_created = False
+    # One random draw per season; the game index keeps ids unique within it.
+    suffix_base = uuid4().hex[:6]
     for index, ((week, home_team, away_team), summary) in enumerate(zip(schedule, result.game_results)):
-        game_id = f"{season_row.season_id}-W{week:02d}-{home_team}-{away_team}-{uuid4().hex[:6]}"
-        game_row = GameRow(
-            game_id=game_id,
-            season_id=season_row.season_id,
-            week=week,
-            home_team_id=home_team,
-            away_team_id=away_team,
-            played=True,
+        game_id = f"{season_row.season_id}-W{week:02d}-{home_team}-{away_team}-{suffix_base}{index:04x}"
+        game_rows.append(
+            {
+                "game_id": game_id,
+                "season_id": season_row.season_id,
+                "week": week,
+                "home_team_id": home_team,
+                "away_team_id": away_team,
+                "scheduled_at": None,
+                "played": True,
+            }
         )
-        session.add(game_row)
-
-        session.add(
-            BoxScoreRow(
-                game_id=game_id,
-                team_id=home_team,
-                player_id=None,
-                stat_type="team_game",
-                stat_payload=summary.home_boxscore.get("teams", {}),
-            )
-        )
-        for player_id, stats in summary.home_boxscore.get("players", {}).items():
-            session.add(
-                BoxScoreRow(
-                    game_id=game_id,
-                    team_id=home_team,
-                    player_id=player_id,
-                    stat_type="player_game",
-                    stat_payload=stats,
-                )
-            )
-        session.add(
-            BoxScoreRow(
-                game_id=game_id,
-                team_id=away_team,
-                player_id=None,
-                stat_type="team_game",
-                stat_payload=summary.away_boxscore.get("teams", {}),
-            )
-        )
-        for player_id, stats in summary.away_boxscore.get("players", {}).items():
-            session.add(
-                BoxScoreRow(
-                    game_id=game_id,
-                    team_id=away_team,
-                    player_id=player_id,
-                    stat_type="player_game",
-                    stat_payload=stats,
-                )
-            )
 
+        box_rows.extend(_iter_box_rows(game_id, home_team, away_team, summary))
         games_payload.append(
             GameResultEntry(
                 game_id=game_id,
@@ -193,33 +180,70 @@ def _persist_season(
             )
         )
         if midseason_savepoint and not mid_save_created and midpoint and index + 1 >= midpoint:
+            _insert_rows(session, game_rows, box_rows)
             session.commit()
             create_savepoint(midseason_savepoint)
             mid_save_created = True
+    _insert_rows(session, game_rows, box_rows)
     return games_payload
 
 
 def _simulate_single_season(
-    teams: List[TeamRow],
-    players: Dict[str, List[PlayerRow]],
+    rosters: Dict[str, Dict[str, Player]],
     seed: int,
     workers: int,
 ) -> _SimPayload:
-    rosters = _build_rosters(teams, players)
-    if not rosters:
-        raise ValueError("No rosters available for simulation")
     schedule = make_schedule(list(rosters.keys()), seed=seed)
     repo = GameplanRepository(DEFAULT_USER_HOME)
     result = simulate_season(rosters, seed=seed, workers=workers, gameplan_repo=repo)
     return _SimPayload(seed=seed, schedule=schedule, result=result)
 
 
+def _simulate_seasons_in_pool(
+    rosters: Dict[str, Dict[str, Player]],
+    seeds: List[int],
+    workers: int,
+) -> List[_SimPayload]:
+    # Each season runs in its own worker process of the shared pool, with
+    # games inside a season kept sequential. At most ``workers`` seasons are
+    # in flight at once, so the request's worker count still bounds its share
+    # of the pool.
+    pool = simulation_pool()
+    pending: Deque[Future[_SimPayload]] = deque()
+    results: List[_SimPayload] = []
+    try:
+        for seed in seeds:
+            if len(pending) >= workers:
+                results.append(pending.popleft().result())
+            pending.append(pool.submit(_simulate_single_season, rosters, seed, 1))
+        while pending:
+            results.append(pending.popleft().result())
+    finally:
+        for future in pending:
+            future.cancel()
+    return results
+
+
+def _emit_exports(season_id: str, result: SeasonResult) -> None:
+    export_root = DEFAULT_EXPORTS_ROOT / season_id
+    export_standings(result, export_root / "standings.csv")
+    export_team_stats(result, export_root / "team_stats.csv")
+    export_player_stats(result, export_root / "player_stats.csv")
+    export_injuries(result, export_root / "injuries.json")
+    draft_results = [
+        {"team_id": team_id, "round": 1, "overall": order + 1}
+        for order, (team_id, _, _) in enumerate(result.standings)
+    ]
+    export_draft_results(draft_results, export_root / "draft_results.json")
+
+
 @router.post("/run", response_model=SeasonRunResponse, status_code=status.HTTP_201_CREATED)
-async def run_season(
+def run_season(
     payload: SeasonRunRequest,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(db_session),
 ) -> SeasonRunResponse:
-    teams = session.exec(select(TeamRow)).all()
+    teams = session.exec(_STMT_TEAMS).all()
     if not teams:
         raise HTTPException(status_code=400, detail="No teams present in database. Seed a league first.")
     players = _players_by_team(session)
@@ -228,31 +252,21 @@ async def run_season(
 
     seeds = [payload.seed + index for index in range(payload.seasons)]
 
-    if payload.seasons > 1 and payload.workers > 1:
-        game_workers = max(1, payload.workers // payload.seasons)
-    else:
-        game_workers = payload.workers
-    if game_workers < 1:
-        game_workers = 1
-
-    def runner(seed: int) -> _SimPayload:
-        return _simulate_single_season(teams, players, seed, game_workers)
-
-    sim_results: List[_SimPayload] = []
-    if payload.workers > 1 and payload.seasons > 1:
-        with ThreadPoolExecutor(max_workers=payload.workers) as executor:
-            futures = [executor.submit(runner, seed) for seed in seeds]
-            for future in futures:
-                try:
-                    sim_results.append(future.result())
-                except ValueError as exc:
-                    raise HTTPException(status_code=400, detail=str(exc)) from exc
-    else:
-        for seed in seeds:
-            try:
-                sim_results.append(await run_in_threadpool(runner, seed))
-            except ValueError as exc:
-                raise HTTPException(status_code=400, detail=str(exc)) from exc
+    game_workers = max(1, payload.workers)
+
+    rosters = _build_rosters(teams, players)
+    if not rosters:
+        raise HTTPException(status_code=400, detail="No rosters available for simulation")
+
+    # The handler is synchronous, so FastAPI already runs it (simulation, DB
+    # writes and exports) on its threadpool; no extra thread hops needed.
+    try:
+        if payload.workers > 1 and payload.seasons > 1:
+            sim_results = _simulate_seasons_in_pool(rosters, seeds, payload.workers)
+        else:
+            sim_results = [_simulate_single_season(rosters, seed, game_workers) for seed in seeds]
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     summaries: List[SeasonRunSummary] = []
     base_year = payload.starting_year or 2025
@@ -276,17 +290,8 @@ async def run_season(
         pre_draft_name = f"{season_id}_pre_draft"
         create_savepoint(pre_draft_name)
 
-        export_root = Path("data/exports") / season_id
-        export_root.mkdir(parents=True, exist_ok=True)
-        export_standings(sim_payload.result, export_root / "standings.csv")
-        export_team_stats(sim_payload.result, export_root / "team_stats.csv")
-        export_player_stats(sim_payload.result, export_root / "player_stats.csv")
-        export_injuries(sim_payload.result, export_root / "injuries.json")
-        draft_results = [
-            {"team_id": team_id, "round": 1, "overall": order + 1}
-            for order, (team_id, _, _) in enumerate(sim_payload.result.standings)
-        ]
-        export_draft_results(draft_results, export_root / "draft_results.json")
+        # Export files are not part of the response; write them after it is sent.
+        background_tasks.add_task(_emit_exports, season_id, sim_payload.result)
 
         standings = [
             StandingEntry(team_id=team_id, wins=wins, losses=losses)
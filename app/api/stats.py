@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Dict
+from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import bindparam, func, true
 from sqlmodel import Session, select
 
 from app.api.deps import db_session
@@ -28,56 +28,91 @@ class PlayerStatsResponse(BaseModel):
     per_game: Dict[str, float]
 
 
-def _aggregate_nested(rows: list[BoxScoreRow]) -> Dict[str, Dict[str, float]]:
-    totals: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
-    for row in rows:
-        payload = row.stat_payload or {}
-        for phase, stats in payload.items():
-            if not isinstance(stats, dict):
-                continue
-            phase_bucket = totals[phase]
-            for key, value in stats.items():
-                phase_bucket[key] += float(value)
-    return {phase: dict(stats) for phase, stats in totals.items()}
+# json_each yields JSON booleans as 1/0, so flag stats sum like counters.
+_NUMERIC_JSON_TYPES = ("integer", "real", "true", "false")
+
+
+def _json_entries(document: Any, name: str) -> Any:
+    """SQLite ``json_each`` over a JSON column/value as a joinable table."""
+
+    return func.json_each(document).table_valued("key", "value", "type").alias(name)
+
+
+# Statements are built once with bind parameters so SQLAlchemy can reuse the
+# compiled SQL from its cache instead of reconstructing the query per request.
+_TEAM_CRITERIA = (BoxScoreRow.team_id == bindparam("team_id"), BoxScoreRow.player_id.is_(None))
+_PLAYER_CRITERION = BoxScoreRow.player_id == bindparam("player_id")
+
+
+def _count_games(*criteria: Any) -> Any:
+    return select(func.count()).select_from(BoxScoreRow).where(*criteria)
+
+
+def _team_totals_statement() -> Any:
+    phase = _json_entries(BoxScoreRow.stat_payload, "phase")
+    stat = _json_entries(phase.c.value, "stat")
+    return (
+        select(phase.c.key, stat.c.key, func.sum(stat.c.value))
+        .select_from(BoxScoreRow)
+        .join(phase, true())
+        .join(stat, true())
+        .where(*_TEAM_CRITERIA, phase.c.type == "object", stat.c.type.in_(_NUMERIC_JSON_TYPES))
+        .group_by(phase.c.key, stat.c.key)
+    )
+
+
+def _player_totals_statement() -> Any:
+    stat = _json_entries(BoxScoreRow.stat_payload, "stat")
+    return (
+        select(stat.c.key, func.sum(stat.c.value))
+        .select_from(BoxScoreRow)
+        .join(stat, true())
+        .where(_PLAYER_CRITERION, stat.c.type.in_(_NUMERIC_JSON_TYPES))
+        .group_by(stat.c.key)
+    )
+
+
+_STMT_TEAM_GAMES = _count_games(*_TEAM_CRITERIA)
+# Sum every phase/stat pair inside SQLite rather than walking payloads in Python.
+_STMT_TEAM_TOTALS = _team_totals_statement()
+_STMT_PLAYER_GAMES = _count_games(_PLAYER_CRITERION)
+_STMT_PLAYER_TEAMS = (
+    select(BoxScoreRow.team_id).where(_PLAYER_CRITERION).distinct().order_by(BoxScoreRow.team_id)
+)
+_STMT_PLAYER_TOTALS = _player_totals_statement()
 
 
 @router.get("/team/{team_id}", response_model=TeamStatsResponse)
 async def team_stats(team_id: str, session: Session = Depends(db_session)) -> TeamStatsResponse:
-    rows = session.exec(
-        select(BoxScoreRow).where(BoxScoreRow.team_id == team_id, BoxScoreRow.player_id.is_(None))
-    ).all()
-    if not rows:
+    params = {"team_id": team_id}
+    games = session.exec(_STMT_TEAM_GAMES, params=params).one()
+    if not games:
         raise HTTPException(status_code=404, detail=f"No stats found for team '{team_id}'")
-    totals = _aggregate_nested(rows)
-    games = len(rows)
+    rows = session.exec(_STMT_TEAM_TOTALS, params=params).all()
+    totals: Dict[str, Dict[str, float]] = {}
+    for phase_key, stat_key, value in rows:
+        totals.setdefault(phase_key, {})[stat_key] = float(value)
     per_game = {
-        phase: {key: value / games for key, value in stats.items()}
-        for phase, stats in totals.items()
+        phase_key: {key: value / games for key, value in stats.items()}
+        for phase_key, stats in totals.items()
     }
     return TeamStatsResponse(team_id=team_id, games=games, totals=totals, per_game=per_game)
 
 
 @router.get("/player/{player_id}", response_model=PlayerStatsResponse)
 async def player_stats(player_id: str, session: Session = Depends(db_session)) -> PlayerStatsResponse:
-    rows = session.exec(
-        select(BoxScoreRow).where(BoxScoreRow.player_id == player_id)
-    ).all()
-    if not rows:
+    params = {"player_id": player_id}
+    games = session.exec(_STMT_PLAYER_GAMES, params=params).one()
+    if not games:
         raise HTTPException(status_code=404, detail=f"No stats found for player '{player_id}'")
-    totals: Dict[str, float] = defaultdict(float)
-    team_ids: set[str] = set()
-    for row in rows:
-        team_ids.add(row.team_id)
-        payload = row.stat_payload or {}
-        for key, value in payload.items():
-            if isinstance(value, (int, float)):
-                totals[key] += float(value)
-    games = len(rows)
+    team_ids = session.exec(_STMT_PLAYER_TEAMS, params=params).all()
+    rows = session.exec(_STMT_PLAYER_TOTALS, params=params).all()
+    totals = {key: float(value) for key, value in rows}
     per_game = {key: value / games for key, value in totals.items()}
     return PlayerStatsResponse(
         player_id=player_id,
-        team_ids=sorted(team_ids),
+        team_ids=list(team_ids),
         games=games,
-        totals=dict(totals),
+        totals=totals,
         per_game=per_game,
     )
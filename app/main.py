@@ -1,17 +1,29 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import game as game_api, league as league_api, plays as plays_api, season as season_api, stats as stats_api
+from app.api.executors import shutdown_simulation_pool
 from domain.db import create_all
 
 APP_VERSION = "0.1.0"
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    shutdown_simulation_pool()
+
+
 app = FastAPI(
     title="Gridiron Sim API",
     version=APP_VERSION,
     description="Public surface for league management and simulations.",
+    lifespan=lifespan,
 )
 
 create_all()
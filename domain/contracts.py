@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import csv
-import json
+import io
 import logging
 from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import orjson
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session, select
 
 from domain.db import ContractRow, engine
@@ -18,8 +21,24 @@ LOGGER = logging.getLogger("domain.contracts")
 
 CAP_LIMIT = 210_000_000.0
 
+_CONTRACT_UPSERT_COLUMNS = (
+    "player_id",
+    "team_id",
+    "player_name",
+    "position",
+    "years",
+    "base_salary",
+    "signing_bonus",
+    "signing_year",
+    "status",
+)
 
-@dataclass
+# Shared by every repository; sessions draw pooled connections from the engine
+# and skip autoflush since every write is an explicit statement.
+_SESSION_FACTORY = sessionmaker(bind=engine, class_=Session, expire_on_commit=False, autoflush=False)
+
+
+@dataclass(slots=True)
 class ContractRecord:
     contract_id: str
     player_id: str
@@ -52,7 +71,7 @@ class ContractRecord:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CapSummary:
     cap_limit: float
     cap_used: float
@@ -60,34 +79,73 @@ class CapSummary:
     dead_money: float
 
 
+_CAP_LIMIT_CENTS = round(CAP_LIMIT * 100)
+
+
+def _cap_charges(contract: ContractRecord) -> tuple[int, int]:
+    """Return the (cap hit, dead money) a contract contributes to its team, in cents.
+
+    Totals are summed as integers so running and recomputed sums agree exactly.
+    """
+
+    if contract.status.lower() == "active":
+        return round(contract.cap_hit * 100), 0
+    dead = max(0.0, contract.signing_bonus - (contract.signing_bonus / max(1, contract.years)))
+    return 0, round(dead * 100)
+
+
+def _cap_totals(contracts: Iterable[ContractRecord]) -> tuple[int, int]:
+    cap_used = 0
+    dead_money = 0
+    for contract in contracts:
+        used, dead = _cap_charges(contract)
+        cap_used += used
+        dead_money += dead
+    return cap_used, dead_money
+
+
+def _summary_from_totals(cap_used: int, dead_money: int) -> CapSummary:
+    return CapSummary(
+        cap_limit=CAP_LIMIT,
+        cap_used=cap_used / 100,
+        cap_available=(_CAP_LIMIT_CENTS - cap_used - dead_money) / 100,
+        dead_money=dead_money / 100,
+    )
+
+
 class ContractsRepository:
     """Persistence helper for contracts and salary cap calculations."""
 
     def __init__(self, user_home: Path) -> None:
-        self._engine = engine
         self._fallback_path = user_home / "settings" / "contracts.json"
         self._fallback_path.parent.mkdir(parents=True, exist_ok=True)
         self._exports_dir = user_home / "exports"
         self._roster_repo = RosterRepository(user_home)
-        self._cache: Dict[str, List[ContractRecord]] = {}
+        # Records are treated as values (changes go through ``replace``), so the
+        # cache holds them in tuples and callers get shallow list copies.
+        self._cache: Dict[str, Tuple[ContractRecord, ...]] = {}
+        # Parsed contracts.json plus the (mtime_ns, size) it was read or written
+        # at; other repositories (GM page, trades) write the same file.
+        self._fallback_data: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._fallback_signature: Tuple[int, int] | None = None
 
     # ------------------------------------------------------------------
     # Loading helpers
     # ------------------------------------------------------------------
     def list_contracts(self, team_id: str) -> List[ContractRecord]:
         if team_id in self._cache:
-            return [replace(c) for c in self._cache[team_id]]
+            return list(self._cache[team_id])
         contracts = self._load_from_db(team_id)
         if not contracts:
             contracts = self._load_from_json(team_id)
         if not contracts:
             contracts = self._generate_contracts(team_id)
             self._persist_bulk(team_id, contracts)
-        self._cache[team_id] = [replace(c) for c in contracts]
-        return [replace(c) for c in contracts]
+        self._cache[team_id] = tuple(contracts)
+        return list(contracts)
 
     def _session(self) -> Session:
-        return Session(self._engine, expire_on_commit=False)
+        return _SESSION_FACTORY()
 
     def _load_from_db(self, team_id: str) -> List[ContractRecord]:
         try:
@@ -98,16 +156,31 @@ class ContractsRepository:
             return []
         return [self._row_to_contract(row) for row in rows]
 
-    def _load_from_json(self, team_id: str) -> List[ContractRecord]:
-        if not self._fallback_path.exists():
-            return []
+    def _fallback_stat(self) -> Tuple[int, int] | None:
         try:
-            data = json.loads(self._fallback_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:  # pragma: no cover - defensive
-            LOGGER.warning("Malformed contracts fallback; resetting")
-            return []
+            stat = self._fallback_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _fallback_document(self) -> Dict[str, List[Dict[str, Any]]]:
+        signature = self._fallback_stat()
+        if self._fallback_data is not None and signature is not None and signature == self._fallback_signature:
+            return self._fallback_data
+        data: Dict[str, List[Dict[str, Any]]] = {}
+        if signature is not None:
+            try:
+                data = orjson.loads(self._fallback_path.read_bytes())
+            except orjson.JSONDecodeError:  # pragma: no cover - defensive
+                LOGGER.warning("Malformed contracts fallback; resetting")
+                data = {}
+        self._fallback_data = data
+        self._fallback_signature = signature
+        return data
+
+    def _load_from_json(self, team_id: str) -> List[ContractRecord]:
         contracts: List[ContractRecord] = []
-        for payload in data.get(team_id, []):
+        for payload in self._fallback_document().get(team_id, []):
             try:
                 contracts.append(ContractRecord(**payload))
             except TypeError:
@@ -172,33 +245,28 @@ class ContractsRepository:
     def _persist_bulk(self, team_id: str, contracts: Iterable[ContractRecord]) -> None:
         contracts = list(contracts)
         try:
-            with self._session() as session:
-                for contract in contracts:
-                    row = session.get(ContractRow, contract.contract_id)
-                    if row is None:
-                        row = ContractRow(contract_id=contract.contract_id)
-                    row.player_id = contract.player_id
-                    row.team_id = contract.team_id
-                    row.player_name = contract.player_name
-                    row.position = contract.position  # type: ignore[assignment]
-                    row.years = contract.years
-                    row.base_salary = contract.base_salary
-                    row.signing_bonus = contract.signing_bonus
-                    row.signing_year = contract.signing_year
-                    row.status = contract.status
-                    session.add(row)
-                session.commit()
+            if contracts:
+                # One INSERT ... ON CONFLICT DO UPDATE covers new and existing rows.
+                stmt = sqlite_insert(ContractRow).values([contract.to_dict() for contract in contracts])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["contract_id"],
+                    set_={column: stmt.excluded[column] for column in _CONTRACT_UPSERT_COLUMNS},
+                )
+                with _SESSION_FACTORY.begin() as session:
+                    session.execute(stmt)
         except SQLAlchemyError as exc:  # pragma: no cover - defensive
             LOGGER.warning("Unable to persist contracts for %s: %s", team_id, exc)
-        self._write_fallback(team_id, contracts)
+        self._fallback_document()[team_id] = [contract.to_dict() for contract in contracts]
+        self.flush_fallback()
 
-    def _write_fallback(self, team_id: str, contracts: List[ContractRecord]) -> None:
+    def flush_fallback(self) -> None:
+        """Write the in-memory contracts fallback to disk in a single pass."""
+
+        if self._fallback_data is None:
+            return
         try:
-            data = {}
-            if self._fallback_path.exists():
-                data = json.loads(self._fallback_path.read_text(encoding="utf-8"))
-            data[team_id] = [contract.to_dict() for contract in contracts]
-            self._fallback_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            self._fallback_path.write_bytes(orjson.dumps(self._fallback_data, option=orjson.OPT_INDENT_2))
+            self._fallback_signature = self._fallback_stat()
         except OSError:  # pragma: no cover - defensive
             LOGGER.warning("Unable to write contracts fallback file")
 
@@ -210,17 +278,7 @@ class ContractsRepository:
         return self._calculate_summary(contracts)
 
     def _calculate_summary(self, contracts: Iterable[ContractRecord]) -> CapSummary:
-        active = [c for c in contracts if c.status.lower() == "active"]
-        inactive = [c for c in contracts if c.status.lower() != "active"]
-        cap_used = sum(c.cap_hit for c in active)
-        dead_money = sum(max(0.0, c.signing_bonus - (c.signing_bonus / max(1, c.years))) for c in inactive)
-        cap_available = CAP_LIMIT - cap_used - dead_money
-        return CapSummary(
-            cap_limit=CAP_LIMIT,
-            cap_used=cap_used,
-            cap_available=cap_available,
-            dead_money=dead_money,
-        )
+        return _summary_from_totals(*_cap_totals(contracts))
 
     def update_contract(self, contract: ContractRecord) -> CapSummary:
         contracts = self.list_contracts(contract.team_id)
@@ -230,19 +288,22 @@ class ContractsRepository:
         summary = self._calculate_summary(updated)
         if summary.cap_available < 0:
             raise ValueError(f"Cap exceeded by ${abs(summary.cap_available):,.0f}")
-        self._cache[contract.team_id] = [replace(c) for c in updated]
+        self._cache[contract.team_id] = tuple(updated)
         self._persist_bulk(contract.team_id, updated)
         return summary
 
     def auto_restructure(self, team_id: str) -> CapSummary:
         contracts = self.list_contracts(team_id)
         contracts.sort(key=lambda c: c.cap_hit, reverse=True)
-        summary = self._calculate_summary(contracts)
-        if summary.cap_available >= 0:
-            return summary
+        # Track the totals incrementally in integer cents so each restructure is
+        # O(1) and the exit test sees exactly the totals a full re-sum returns.
+        cap_used, dead_money = _cap_totals(contracts)
+        if _CAP_LIMIT_CENTS - cap_used - dead_money >= 0:
+            return _summary_from_totals(cap_used, dead_money)
         for idx, contract in enumerate(contracts):
-            if summary.cap_available >= 0:
+            if _CAP_LIMIT_CENTS - cap_used - dead_money >= 0:
                 break
+            old_used, old_dead = _cap_charges(contract)
             converted = contract.base_salary * 0.2
             contract = replace(
                 contract,
@@ -251,8 +312,11 @@ class ContractsRepository:
                 years=min(7, contract.years + 1),
             )
             contracts[idx] = contract
-            summary = self._calculate_summary(contracts)
-        self._cache[team_id] = [replace(c) for c in contracts]
+            new_used, new_dead = _cap_charges(contract)
+            cap_used += new_used - old_used
+            dead_money += new_dead - old_dead
+        summary = _summary_from_totals(cap_used, dead_money)
+        self._cache[team_id] = tuple(contracts)
         self._persist_bulk(team_id, contracts)
         return summary
 
@@ -261,24 +325,33 @@ class ContractsRepository:
         summary = self._calculate_summary(contracts)
         self._exports_dir.mkdir(parents=True, exist_ok=True)
         export_path = self._exports_dir / f"{team_id}_cap_{datetime.utcnow():%Y%m%d%H%M%S}.csv"
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["Player", "Position", "Years", "Base Salary", "Signing Bonus", "Cap Hit", "Status"])
+        writer.writerows(
+            (
+                contract.player_name,
+                contract.position,
+                contract.years,
+                f"{contract.base_salary:,.0f}",
+                f"{contract.signing_bonus:,.0f}",
+                f"{contract.cap_hit:,.0f}",
+                contract.status,
+            )
+            for contract in contracts
+        )
+        writer.writerow([])
+        writer.writerows(
+            (label, "", "", f"{value:,.0f}", "", "", "")
+            for label, value in (
+                ("Cap Limit", summary.cap_limit),
+                ("Cap Used", summary.cap_used),
+                ("Dead Money", summary.dead_money),
+                ("Cap Available", summary.cap_available),
+            )
+        )
         with export_path.open("w", newline="", encoding="utf-8") as handle:
-            writer = csv.writer(handle)
-            writer.writerow(["Player", "Position", "Years", "Base Salary", "Signing Bonus", "Cap Hit", "Status"])
-            for contract in contracts:
-                writer.writerow([
-                    contract.player_name,
-                    contract.position,
-                    contract.years,
-                    f"{contract.base_salary:,.0f}",
-                    f"{contract.signing_bonus:,.0f}",
-                    f"{contract.cap_hit:,.0f}",
-                    contract.status,
-                ])
-            writer.writerow([])
-            writer.writerow(["Cap Limit", "", "", f"{summary.cap_limit:,.0f}", "", "", ""])
-            writer.writerow(["Cap Used", "", "", f"{summary.cap_used:,.0f}", "", "", ""])
-            writer.writerow(["Dead Money", "", "", f"{summary.dead_money:,.0f}", "", "", ""])
-            writer.writerow(["Cap Available", "", "", f"{summary.cap_available:,.0f}", "", "", ""])
+            handle.write(buffer.getvalue())
         return export_path
 
     def transfer_contract(self, player_id: str, from_team: str, to_team: str) -> tuple[CapSummary, CapSummary]:
@@ -288,10 +361,10 @@ class ContractsRepository:
         if contract is None:
             return self._calculate_summary(from_contracts), self._calculate_summary(to_contracts)
         from_contracts = [c for c in from_contracts if c.contract_id != contract.contract_id]
-        self._cache[from_team] = [replace(c) for c in from_contracts]
+        self._cache[from_team] = tuple(from_contracts)
         self._persist_bulk(from_team, from_contracts)
         transferred = replace(contract, team_id=to_team)
         to_contracts.append(transferred)
-        self._cache[to_team] = [replace(c) for c in to_contracts]
+        self._cache[to_team] = tuple(to_contracts)
         self._persist_bulk(to_team, to_contracts)
         return self._calculate_summary(from_contracts), self._calculate_summary(to_contracts)
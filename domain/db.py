@@ -1,21 +1,76 @@
 from __future__ import annotations
 
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
-from typing import Iterator
-
-from sqlalchemy import Column, JSON, Enum as SAEnum, String
+from typing import Any, Iterator
+
+import orjson
+from sqlalchemy import (
+    JSON,
+    Column,
+    Index,
+    SmallInteger,
+    String,
+    TypeDecorator,
+    bindparam,
+    event,
+    inspect,
+    select,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
 from sqlmodel import Field, Session, SQLModel, create_engine
 
 DATABASE_URL = "sqlite:///gridiron.db"
+SCHEMA_VERSION = 4
+_SCHEMA_VERSION_KEY = "schema_version"
+_schema_lock = threading.Lock()
+_schema_ready_engine: Engine | None = None
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON columns (box score payloads, attributes) with orjson."""
+
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 engine = create_engine(
     DATABASE_URL,
     echo=False,
     connect_args={"check_same_thread": False},
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    pool_size=5,
+    max_overflow=10,
+)
+
+# journal_mode stays at the default rollback journal: the packaging build and
+# the Windows launcher ship and copy gridiron.db as a single file, which would
+# miss pages still sitting in a WAL file. In rollback mode only
+# synchronous=FULL is safe against power loss, so it is set explicitly.
+_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=FULL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
 )
 
 
+@event.listens_for(engine, "connect")
+def _configure_sqlite_connection(dbapi_connection: Any, _: Any) -> None:
+    """Apply PRAGMAs once per pooled connection so every checkout reuses them."""
+
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 class PositionEnum(str, Enum):
     """Enumeration of valid football positions for persistence."""
 
@@ -32,7 +87,47 @@ class PositionEnum(str, Enum):
     P = "P"
 
 
-POSITION_COLUMN = SAEnum(PositionEnum, name="football_position")
+# Stable on-disk codes; append new positions, never renumber.
+_POSITION_CODES: dict[PositionEnum, int] = {
+    PositionEnum.QB: 0,
+    PositionEnum.RB: 1,
+    PositionEnum.WR: 2,
+    PositionEnum.TE: 3,
+    PositionEnum.OL: 4,
+    PositionEnum.DL: 5,
+    PositionEnum.LB: 6,
+    PositionEnum.CB: 7,
+    PositionEnum.S: 8,
+    PositionEnum.K: 9,
+    PositionEnum.P: 10,
+}
+_POSITIONS_BY_CODE: dict[int, PositionEnum] = {code: position for position, code in _POSITION_CODES.items()}
+
+
+class PositionType(TypeDecorator):
+    """Store ``PositionEnum`` as a small integer code instead of its name."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> int | None:
+        if value is None:
+            return None
+        return _POSITION_CODES[PositionEnum(value)]
+
+    def process_result_value(self, value: Any, dialect: Any) -> PositionEnum | None:
+        if value is None:
+            return None
+        if isinstance(value, int):
+            return _POSITIONS_BY_CODE[value]
+        # Tables created before the switch keep a text column: SQLite hands
+        # back legacy names ("QB") or the new codes stored as text ("0").
+        if value.isdigit():
+            return _POSITIONS_BY_CODE[int(value)]
+        return PositionEnum(value)
+
+
+POSITION_COLUMN = PositionType()
 
 
 class PlayerRow(SQLModel, table=True):
@@ -42,12 +137,29 @@ class PlayerRow(SQLModel, table=True):
     name: str = Field(index=True)
     position: PositionEnum = Field(sa_column=Column(POSITION_COLUMN))
     jersey_number: int = Field(ge=0, le=99)
-    team_id: str | None = Field(default=None, foreign_key="teamrow.team_id")
+    team_id: str | None = Field(default=None, foreign_key="teamrow.team_id", index=True)
     attributes: dict[str, int] | None = Field(
         default=None,
         sa_column=Column(JSON, nullable=True),
         description="Serialized attribute ratings",
     )
+    overall: int | None = Field(
+        default=None, description="Mean attribute rating, maintained on write"
+    )
+
+
+def player_overall(attributes: dict[str, int] | None) -> int | None:
+    """Return the truncated mean of ``attributes`` (``None`` when there are none)."""
+
+    if not attributes:
+        return None
+    return int(sum(attributes.values()) / len(attributes))
+
+
+@event.listens_for(PlayerRow, "before_insert")
+@event.listens_for(PlayerRow, "before_update")
+def _sync_player_overall(_mapper: Any, _connection: Any, target: PlayerRow) -> None:
+    target.overall = player_overall(target.attributes)
 
 
 class TeamRow(SQLModel, table=True):
@@ -115,6 +227,8 @@ class SeasonRow(SQLModel, table=True):
 class GameRow(SQLModel, table=True):
     """Individual scheduled or completed games."""
 
+    __table_args__ = (Index("ix_gamerow_season_week", "season_id", "week"),)
+
     game_id: str = Field(primary_key=True)
     season_id: str | None = Field(default=None, foreign_key="seasonrow.season_id")
     week: int = Field(ge=1, le=25)
@@ -128,7 +242,7 @@ class BoxScoreRow(SQLModel, table=True):
     """Per-game statistics for teams and players."""
 
     id: int | None = Field(default=None, primary_key=True)
-    game_id: str = Field(foreign_key="gamerow.game_id")
+    game_id: str = Field(foreign_key="gamerow.game_id", index=True)
     team_id: str = Field(foreign_key="teamrow.team_id")
     player_id: str | None = Field(default=None, foreign_key="playerrow.player_id")
     stat_type: str = Field(description="Statistic category identifier")
@@ -143,7 +257,7 @@ class EventRow(SQLModel, table=True):
     """Log of discrete events occurring within a game."""
 
     id: int | None = Field(default=None, primary_key=True)
-    game_id: str = Field(foreign_key="gamerow.game_id")
+    game_id: str = Field(foreign_key="gamerow.game_id", index=True)
     occurred_at: datetime = Field(default_factory=datetime.utcnow)
     event_type: str = Field(description="Event type label")
     description: str | None = None
@@ -165,10 +279,103 @@ class DraftProspectRow(SQLModel, table=True):
     scouting_report: str | None = None
 
 
-def create_all() -> None:
-    """Create all SQLModel tables in the configured SQLite database."""
+def _schema_is_current() -> bool:
+    try:
+        with engine.connect() as connection:
+            stored = connection.execute(
+                select(AppSettingRow.value).where(AppSettingRow.key == _SCHEMA_VERSION_KEY)
+            ).scalar_one_or_none()
+    except OperationalError:
+        # Fresh database without the settings table yet.
+        return False
+    return stored == str(SCHEMA_VERSION)
 
-    SQLModel.metadata.create_all(engine)
+
+def create_all() -> None:
+    """Create all SQLModel tables in the configured SQLite database.
+
+    A warm database whose recorded schema version matches ``SCHEMA_VERSION``
+    skips the per-table existence probes entirely; bump the constant whenever
+    tables, columns or indexes change. Within a process the check runs once
+    per engine, so repeated calls from different entry points are free.
+    """
+
+    global _schema_ready_engine
+
+    if _schema_ready_engine is engine:
+        return
+    with _schema_lock:
+        if _schema_ready_engine is not engine:
+            _ensure_schema()
+            _schema_ready_engine = engine
+
+
+def _ensure_schema() -> None:
+    if _schema_is_current():
+        return
+    with engine.begin() as connection:
+        SQLModel.metadata.create_all(connection, checkfirst=True)
+        # create_all only emits indexes alongside new tables; add any that an
+        # older database is missing (CREATE INDEX IF NOT EXISTS semantics).
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+        _add_missing_columns(connection)
+        _backfill_player_overall(connection)
+        _migrate_position_names(connection)
+        stmt = sqlite_insert(AppSettingRow).values(key=_SCHEMA_VERSION_KEY, value=str(SCHEMA_VERSION))
+        connection.execute(
+            stmt.on_conflict_do_update(index_elements=["key"], set_={"value": stmt.excluded.value})
+        )
+
+
+def _add_missing_columns(connection: Connection) -> None:
+    """Add nullable columns that an older database's existing tables lack."""
+
+    inspector = inspect(connection)
+    for table in SQLModel.metadata.sorted_tables:
+        present = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in present or not column.nullable or column.primary_key:
+                continue
+            column_type = column.type.compile(dialect=connection.dialect)
+            connection.exec_driver_sql(
+                f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'
+            )
+
+
+def _backfill_player_overall(connection: Connection) -> None:
+    rows = connection.execute(
+        select(PlayerRow.player_id, PlayerRow.attributes).where(PlayerRow.overall.is_(None))
+    ).all()
+    params = [
+        {"row_id": player_id, "row_overall": overall}
+        for player_id, attributes in rows
+        if (overall := player_overall(attributes)) is not None
+    ]
+    if params:
+        connection.execute(
+            update(PlayerRow)
+            .where(PlayerRow.player_id == bindparam("row_id"))
+            .values(overall=bindparam("row_overall")),
+            params,
+        )
+
+
+def _migrate_position_names(connection: Connection) -> None:
+    """Rewrite legacy position names ("QB") as the codes ``PositionType`` writes."""
+
+    params = [(code, position.value) for position, code in _POSITION_CODES.items()]
+    for table in SQLModel.metadata.sorted_tables:
+        for column in table.columns:
+            if not isinstance(column.type, PositionType):
+                continue
+            # Raw SQL: a Core update would run the bound name through
+            # PositionType and compare against its code instead.
+            connection.exec_driver_sql(
+                f'UPDATE "{table.name}" SET "{column.name}" = ? WHERE "{column.name}" = ?',
+                params,
+            )
 
 
 @contextmanager
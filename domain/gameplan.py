@@ -1,12 +1,25 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import os
+import random
+import threading
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence
 
-from domain.teams import TeamInfo, TeamRepository
+import numpy as np
+import orjson
+
+if os.name == "nt":  # pragma: no cover - exercised by the Windows launcher
+    import msvcrt
+else:
+    import fcntl
+
+if TYPE_CHECKING:
+    from domain.teams import TeamInfo, TeamRepository
 
 _DEFAULT_SITUATIONS: List[tuple[str, str, str]] = [
     ("1st & 10", "Inside Zone 11", "Motion to Trips"),
@@ -17,8 +30,79 @@ _DEFAULT_SITUATIONS: List[tuple[str, str, str]] = [
     ("Goal Line", "Power Iso", "Boot Fake"),
 ]
 
+_JOURNAL_COMPACT_MIN_BYTES = 64 * 1024
+_EPOCH = datetime(1970, 1, 1)
+
+
+_PlanKey = tuple[str, str, int]
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``path`` across processes until the block exits."""
+
+    with path.open("a+b") as handle:
+        if os.name == "nt":  # pragma: no cover - exercised by the Windows launcher
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _storage_key(key: _PlanKey) -> str:
+    """Plan keys are tuples in memory and ``team:opponent:week`` strings on disk."""
+
+    return f"{key[0]}:{key[1]}:{key[2]}"
+
+
+def _parse_storage_key(raw: object) -> _PlanKey | None:
+    if not isinstance(raw, str):
+        return None
+    team_id, _, rest = raw.partition(":")
+    opponent_id, _, week = rest.rpartition(":")
+    try:
+        return (team_id, opponent_id, int(week))
+    except ValueError:
+        return None
+
+
+def _epoch_seconds(moment: datetime) -> int:
+    """Naive-UTC datetime to whole Unix seconds, the stored timestamp format."""
+
+    return int((moment - _EPOCH).total_seconds())
+
 
-@dataclass
+def _timestamp_from_payload(raw: object) -> datetime:
+    # Epoch integers are the stored format; ISO strings come from files
+    # written before the switch and from hand-edited exports.
+    if isinstance(raw, (int, float)) and not isinstance(raw, bool):
+        return _EPOCH + timedelta(seconds=raw)
+    if isinstance(raw, str):
+        try:
+            return datetime.fromisoformat(raw)
+        except ValueError:
+            pass
+    return datetime.utcnow()
+
+
+def _clamp_percent(value: float) -> int:
+    # Conditional expressions avoid two builtin calls per slider; the common
+    # in-range int case returns without any conversion.
+    if 0 <= value <= 100:
+        return value if type(value) is int else int(value)
+    return 0 if value < 0 else 100
+
+
+@dataclass(slots=True)
 class GameplanTendencies:
     """High-level play-calling sliders for a single gameplan."""
 
@@ -28,10 +112,10 @@ class GameplanTendencies:
     zone_rate: int = 62
 
     def clamp(self) -> None:
-        self.run_rate = int(min(max(self.run_rate, 0), 100))
-        self.deep_shot_rate = int(min(max(self.deep_shot_rate, 0), 100))
-        self.blitz_rate = int(min(max(self.blitz_rate, 0), 100))
-        self.zone_rate = int(min(max(self.zone_rate, 0), 100))
+        self.run_rate = _clamp_percent(self.run_rate)
+        self.deep_shot_rate = _clamp_percent(self.deep_shot_rate)
+        self.blitz_rate = _clamp_percent(self.blitz_rate)
+        self.zone_rate = _clamp_percent(self.zone_rate)
 
     def to_dict(self) -> Dict[str, int]:
         self.clamp()
@@ -52,7 +136,7 @@ class GameplanTendencies:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SituationTendency:
     """Preferred calls for a down & distance bucket."""
 
@@ -79,7 +163,19 @@ class SituationTendency:
         )
 
 
-@dataclass
+# SituationTendency is frozen, so every generated plan can share these.
+_DEFAULT_SITUATION_TENDENCIES: tuple[SituationTendency, ...] = tuple(
+    SituationTendency(
+        bucket=bucket,
+        primary_call=primary,
+        secondary_call=secondary,
+        notes="Exploit linebackers" if "3rd" in bucket else "",
+    )
+    for bucket, primary, secondary in _DEFAULT_SITUATIONS
+)
+
+
+@dataclass(slots=True)
 class WeeklyGameplan:
     """Complete weekly strategy for a given opponent."""
 
@@ -93,14 +189,14 @@ class WeeklyGameplan:
     last_execution: GameplanExecution | None = None
 
     def to_dict(self) -> Dict[str, object]:
-        return {
+        payload: Dict[str, object] = {
             "team_id": self.team_id,
             "opponent_id": self.opponent_id,
             "week": self.week,
             "tendencies": self.tendencies.to_dict(),
             "situations": [item.to_dict() for item in self.situations],
             "notes": self.notes,
-            "last_modified": self.last_modified.isoformat(),
+            "last_modified": _epoch_seconds(self.last_modified),
         }
         if self.last_execution is not None:
             payload["last_execution"] = self.last_execution.to_dict()
@@ -111,15 +207,7 @@ class WeeklyGameplan:
         tendency_payload = payload.get("tendencies", {})
         situations_payload = payload.get("situations", [])
         notes = payload.get("notes", "")
-        raw_timestamp = payload.get("last_modified")
-        timestamp: datetime
-        if isinstance(raw_timestamp, str):
-            try:
-                timestamp = datetime.fromisoformat(raw_timestamp)
-            except ValueError:
-                timestamp = datetime.utcnow()
-        else:
-            timestamp = datetime.utcnow()
+        timestamp = _timestamp_from_payload(payload.get("last_modified"))
         execution_payload = payload.get("last_execution")
         execution = None
         if isinstance(execution_payload, dict):
@@ -141,7 +229,7 @@ class WeeklyGameplan:
         return plan
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameplanPreview:
     """Result of a quick Monte Carlo-style tendency preview."""
 
@@ -156,7 +244,7 @@ class GameplanPreview:
     expected_points: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameplanComparison:
     """Difference between planned tendencies and actual results."""
 
@@ -182,7 +270,7 @@ class GameplanComparison:
 
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameplanExecution:
     actual: Dict[str, float]
     comparison: GameplanComparison
@@ -198,7 +286,7 @@ class GameplanExecution:
                 "zone_delta": float(self.comparison.zone_delta),
                 "summary": self.comparison.summary(),
             },
-            "recorded_at": self.recorded_at.isoformat(),
+            "recorded_at": _epoch_seconds(self.recorded_at),
         }
         return payload
 
@@ -222,16 +310,9 @@ class GameplanExecution:
             )
         else:
             comparison = GameplanComparison(0.0, 0.0, 0.0, 0.0)
-        recorded_raw = payload.get("recorded_at")
-        if isinstance(recorded_raw, str):
-            try:
-                recorded_at = datetime.fromisoformat(recorded_raw)
-            except ValueError:
-                recorded_at = datetime.utcnow()
-        else:
-            recorded_at = datetime.utcnow()
+        recorded_at = _timestamp_from_payload(payload.get("recorded_at"))
         return GameplanExecution(actual=actual, comparison=comparison, recorded_at=recorded_at)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpponentScoutingReport:
     """Lightweight opponent summary shown alongside the gameplan."""
 
@@ -254,9 +335,25 @@ class GameplanRepository:
         settings_dir = user_home / "settings"
         settings_dir.mkdir(parents=True, exist_ok=True)
         self._plans_path = settings_dir / "gameplans.json"
-        self._team_repo = team_repository or TeamRepository()
-        self._plans: Dict[str, Dict[str, object]] = {}
-        self._load()
+        self._journal_path = settings_dir / "gameplans.log"
+        # Serialises journal appends, reloads and compaction between every
+        # repository (GM UI, API, season workers) sharing this settings dir.
+        self._lock_path = settings_dir / "gameplans.lock"
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+        self._snapshot_bytes = 0
+        self._journal_bytes = 0
+        # domain.teams pulls in the league seed data and the database layer;
+        # defer it until an opponent lookup or scouting report needs it.
+        self._team_repo: Optional[TeamRepository] = team_repository
+        self._team_order_cache: tuple[tuple[str, ...], Dict[str, int]] | None = None
+        # Plans are held as their encoded JSON payloads so a save only encodes
+        # the plan that changed; the file is stitched together from fragments.
+        self._plans: Dict[_PlanKey, bytes] = {}
+        # (mtime_ns, size) of the snapshot and journal as last seen by this
+        # instance; another repository writing the files invalidates _plans.
+        self._file_signature: tuple[Optional[tuple[int, int]], ...] = ()
+        self._refresh_if_changed()
 
     # ------------------------------------------------------------------
     # Public API
@@ -265,26 +362,37 @@ class GameplanRepository:
         opponent_id = opponent_id or self._default_opponent(team_id, week or 1)
         week = week or 1
         key = self._plan_key(team_id, opponent_id, week)
-        payload = self._plans.get(key)
-        if payload:
-            plan = WeeklyGameplan.from_dict(payload)
-        else:
-            plan = self._generate_default_plan(team_id, opponent_id, week)
-            self.save_plan(plan)
-        return plan
+        with self._locked():
+            encoded = self._plans.get(key)
+            if not encoded:
+                plan = self._generate_default_plan(team_id, opponent_id, week)
+                self.save_plan(plan)
+                return plan
+        return WeeklyGameplan.from_dict(orjson.loads(encoded))
 
     def save_plan(self, plan: WeeklyGameplan) -> WeeklyGameplan:
-        plan.last_modified = datetime.utcnow()
-        key = self._plan_key(plan.team_id, plan.opponent_id, plan.week)
-        self._plans[key] = plan.to_dict()
-        self._persist()
+        self.save_many([plan])
         return plan
 
+    def save_many(self, plans: Iterable[WeeklyGameplan]) -> None:
+        """Save a batch of plans with one timestamp and a single journal write."""
+
+        now = datetime.utcnow()
+        keys = []
+        with self._locked():
+            for plan in plans:
+                plan.last_modified = now
+                key = self._plan_key(plan.team_id, plan.opponent_id, plan.week)
+                self._plans[key] = orjson.dumps(plan.to_dict())
+                keys.append(key)
+            self._append_journal("put", *keys)
+
     def delete_plan(self, team_id: str, opponent_id: str, week: int) -> None:
         key = self._plan_key(team_id, opponent_id, week)
-        if key in self._plans:
-            self._plans.pop(key)
-            self._persist()
+        with self._locked():
+            if key in self._plans:
+                self._plans.pop(key)
+                self._append_journal("del", key)
 
 
     def record_execution(
@@ -294,34 +402,36 @@ class GameplanRepository:
         week: int,
         actual: Dict[str, float],
     ) -> GameplanExecution:
-        plan = self.load_plan(team_id, opponent_id=opponent_id, week=week)
-        comparison = self.compare_to_actual(plan, actual)
-        execution = GameplanExecution(actual=actual, comparison=comparison, recorded_at=datetime.utcnow())
-        key = self._plan_key(team_id, opponent_id, week)
-        entry = self._plans.setdefault(key, plan.to_dict())
-        entry["last_execution"] = execution.to_dict()
-        self._plans[key] = entry
-        self._persist()
-        plan.last_execution = execution
+        with self._locked():
+            plan = self.load_plan(team_id, opponent_id=opponent_id, week=week)
+            comparison = self.compare_to_actual(plan, actual)
+            execution = GameplanExecution(actual=actual, comparison=comparison, recorded_at=datetime.utcnow())
+            plan.last_execution = execution
+            key = self._plan_key(team_id, opponent_id, week)
+            self._plans[key] = orjson.dumps(plan.to_dict())
+            self._append_journal("put", key)
         return execution
 
 
     def list_saved_plans(self, team_id: str) -> List[WeeklyGameplan]:
-        plans: List[WeeklyGameplan] = []
-        for payload in self._plans.values():
-            if payload.get("team_id") == team_id:
-                plans.append(WeeklyGameplan.from_dict(payload))
+        self._refresh_if_changed()
+        # Keys lead with the team id, so only matching plans are decoded.
+        plans = [
+            WeeklyGameplan.from_dict(orjson.loads(encoded))
+            for key, encoded in self._plans.items()
+            if key[0] == team_id
+        ]
         plans.sort(key=lambda plan: (plan.week, plan.opponent_id))
         return plans
 
     def export_plan(self, plan: WeeklyGameplan, destination: Path) -> Path:
         destination.parent.mkdir(parents=True, exist_ok=True)
         payload = plan.to_dict()
-        destination.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        destination.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
         return destination
 
     def import_plan(self, source: Path, *, override_ids: Optional[tuple[str, str, int]] = None) -> WeeklyGameplan:
-        payload = json.loads(source.read_text(encoding="utf-8"))
+        payload = orjson.loads(source.read_bytes())
         plan = WeeklyGameplan.from_dict(payload)
         if override_ids is not None:
             team_id, opponent_id, week = override_ids
@@ -354,6 +464,62 @@ class GameplanRepository:
             expected_points=expected_points,
         )
 
+    def preview_many(self, plans: Sequence[WeeklyGameplan], *, drives: int = 10) -> List[GameplanPreview]:
+        """Vectorised :meth:`preview` for dashboards that preview every saved plan at once."""
+
+        if not plans:
+            return []
+        rates = np.clip(
+            np.array(
+                [
+                    (
+                        plan.tendencies.run_rate,
+                        plan.tendencies.deep_shot_rate,
+                        plan.tendencies.blitz_rate,
+                        plan.tendencies.zone_rate,
+                    )
+                    for plan in plans
+                ],
+                dtype=np.int64,
+            ),
+            0,
+            100,
+        )
+        run_rate, deep_rate, blitz_rate, zone_rate = rates.T
+        total_plays = max(1, drives * 6)
+        # np.rint rounds half to even, matching the builtin round() in preview().
+        expected_run = np.rint(total_plays * run_rate / 100).astype(np.int64)
+        expected_pass = total_plays - expected_run
+        deep_shots = np.rint(expected_pass * deep_rate / 100).astype(np.int64)
+        blitz_calls = np.rint(total_plays * blitz_rate / 100).astype(np.int64)
+        zone_calls = np.rint(total_plays * zone_rate / 100).astype(np.int64)
+        explosive = np.minimum(0.65, 0.15 + deep_rate / 250)
+        takeaway = np.minimum(0.45, 0.10 + blitz_rate / 300)
+        expected_points = total_plays * (0.28 + run_rate / 400)
+        return [
+            GameplanPreview(
+                drives=drives,
+                expected_run_calls=run,
+                expected_pass_calls=passes,
+                expected_deep_shots=deep,
+                expected_blitz_calls=blitz,
+                expected_zone_calls=zone,
+                explosive_play_chance=round(explosive_value, 3),
+                takeaway_chance=round(takeaway_value, 3),
+                expected_points=round(points, 1),
+            )
+            for run, passes, deep, blitz, zone, explosive_value, takeaway_value, points in zip(
+                expected_run.tolist(),
+                expected_pass.tolist(),
+                deep_shots.tolist(),
+                blitz_calls.tolist(),
+                zone_calls.tolist(),
+                explosive.tolist(),
+                takeaway.tolist(),
+                expected_points.tolist(),
+            )
+        ]
+
     def compare_to_actual(self, plan: WeeklyGameplan, actual: Dict[str, float]) -> GameplanComparison:
         tend = plan.tendencies
         run_delta = (actual.get("run_rate", tend.run_rate) - tend.run_rate)
@@ -369,7 +535,9 @@ class GameplanRepository:
 
     def scouting_report(self, team_id: str, opponent_id: Optional[str] = None, week: int | None = None) -> OpponentScoutingReport:
         opponent_id = opponent_id or self._default_opponent(team_id, week or 1)
-        opponent = self._team_repo.find_team(opponent_id) or TeamInfo(opponent_id, opponent_id, opponent_id, opponent_id)
+        from domain.teams import TeamInfo
+
+        opponent = self._teams().find_team(opponent_id) or TeamInfo(opponent_id, opponent_id, opponent_id, opponent_id)
         seed = f"scout-{team_id}-{opponent_id}-{week or 1}"
         rng = _DeterministicRandom(seed)
         record = f"{rng.randrange(6, 13)}-{rng.randrange(4, 11)}"
@@ -402,37 +570,157 @@ class GameplanRepository:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def compact(self) -> None:
+        """Fold the change journal into a fresh ``gameplans.json`` snapshot."""
+
+        with self._locked():
+            self._persist()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the journal lock with ``_plans`` caught up to the files on disk.
+
+        Re-entrant within an instance. Every read-modify-append runs inside it,
+        so no other repository can write between the refresh and the append.
+        """
+
+        with self._thread_lock, ExitStack() as stack:
+            if not self._lock_depth:
+                stack.enter_context(_file_lock(self._lock_path))
+                if self._current_signature() != self._file_signature:
+                    self._load()
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+
     def _load(self) -> None:
-        if not self._plans_path.exists():
-            self._plans = {}
-            return
-        try:
-            payload = json.loads(self._plans_path.read_text(encoding="utf-8"))
-            plans = payload.get("plans") if isinstance(payload, dict) else None
-            if isinstance(plans, dict):
-                self._plans = plans
-            else:
+        self._plans = {}
+        if self._plans_path.exists():
+            try:
+                raw = self._plans_path.read_bytes()
+                payload = orjson.loads(raw)
+                plans = payload.get("plans") if isinstance(payload, dict) else None
+                if isinstance(plans, dict):
+                    self._plans = {
+                        key: orjson.dumps(entry)
+                        for raw_key, entry in plans.items()
+                        if isinstance(entry, dict) and (key := _parse_storage_key(raw_key)) is not None
+                    }
+                self._snapshot_bytes = len(raw)
+            except (orjson.JSONDecodeError, OSError):  # pragma: no cover - defensive
                 self._plans = {}
-        except (json.JSONDecodeError, OSError):  # pragma: no cover - defensive
-            self._plans = {}
+        self._replay_journal()
+        self._file_signature = self._current_signature()
 
-    def _persist(self) -> None:
-        data = {"plans": self._plans, "version": 1}
-        self._plans_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    def _current_signature(self) -> tuple[Optional[tuple[int, int]], ...]:
+        signature = []
+        for path in (self._plans_path, self._journal_path):
+            try:
+                stat = path.stat()
+            except OSError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _refresh_if_changed(self) -> None:
+        # Taking the lock replays whatever other repositories wrote meanwhile.
+        with self._locked():
+            pass
+
+    def _replay_journal(self) -> None:
+        self._journal_bytes = 0
+        try:
+            raw = self._journal_path.read_bytes()
+        except FileNotFoundError:
+            return
+        except OSError:  # pragma: no cover - defensive
+            return
+        self._journal_bytes = len(raw)
+        for line in raw.splitlines():
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # A torn trailing write from an interrupted save; skip it.
+                continue
+            if not isinstance(record, dict):
+                continue
+            key = _parse_storage_key(record.get("key"))
+            if key is None:
+                continue
+            if record.get("op") == "del":
+                self._plans.pop(key, None)
+            elif isinstance(record.get("val"), dict):
+                self._plans[key] = orjson.dumps(record["val"])
+
+    def _append_journal(self, op: str, *keys: _PlanKey) -> None:
+        # Each mutation appends one line instead of rewriting every plan; the
+        # snapshot is rebuilt once the journal outgrows it. Callers hold
+        # _locked(), so the files still match _file_signature before the write.
+        if not keys:
+            return
+        lines = bytearray()
+        for key in keys:
+            record: Dict[str, object] = {"op": op, "key": _storage_key(key)}
+            if op == "put":
+                record["val"] = orjson.Fragment(self._plans[key])
+            lines += orjson.dumps(record)
+            lines += b"\n"
+        with self._journal_path.open("ab") as handle:
+            handle.write(lines)
+        self._journal_bytes += len(lines)
+        if self._journal_bytes > max(2 * self._snapshot_bytes, _JOURNAL_COMPACT_MIN_BYTES):
+            self._persist()
+        else:
+            self._file_signature = self._current_signature()
 
-    def _plan_key(self, team_id: str, opponent_id: str, week: int) -> str:
-        return f"{team_id}:{opponent_id}:{week}"
+    def _persist(self) -> None:
+        # Callers hold _locked(), which already replayed entries other
+        # instances appended, so _plans is the full merged state.
+        plans = {_storage_key(key): orjson.Fragment(encoded) for key, encoded in self._plans.items()}
+        data = orjson.dumps({"plans": plans, "version": 1}, option=orjson.OPT_INDENT_2)
+        partial = self._plans_path.with_suffix(".json.partial")
+        partial.write_bytes(data)
+        os.replace(partial, self._plans_path)
+        self._snapshot_bytes = len(data)
+        self._journal_path.unlink(missing_ok=True)
+        self._journal_bytes = 0
+        self._file_signature = self._current_signature()
+
+    def _plan_key(self, team_id: str, opponent_id: str, week: int) -> _PlanKey:
+        return (team_id, opponent_id, week)
+
+    def _teams(self) -> TeamRepository:
+        if self._team_repo is None:
+            from domain.teams import TeamRepository
+
+            self._team_repo = TeamRepository()
+        return self._team_repo
+
+    def _team_order(self) -> tuple[tuple[str, ...], Dict[str, int]]:
+        # The repository lives as long as the process, across league seeds, so
+        # the ids are re-read on each lookup and only the index map is reused
+        # while they stay the same. An empty league is never cached.
+        team_ids = self._teams().team_ids()
+        cached = self._team_order_cache
+        if cached is not None and cached[0] == team_ids:
+            return cached
+        order = (team_ids, {team_id: idx for idx, team_id in enumerate(team_ids)})
+        self._team_order_cache = order if team_ids else None
+        return order
 
     def _default_opponent(self, team_id: str, week: int) -> str:
-        teams = self._team_repo.list_teams()
-        if not teams:
+        team_ids, indices = self._team_order()
+        if not team_ids:
             return "OPP"
-        indices = {team.team_id: idx for idx, team in enumerate(teams)}
+        count = len(team_ids)
         index = indices.get(team_id, 0)
-        opponent = teams[(index + week) % len(teams)]
-        if opponent.team_id == team_id:
-            opponent = teams[(index + 1) % len(teams)]
-        return opponent.team_id
+        opponent_id = team_ids[(index + week) % count]
+        if opponent_id == team_id:
+            opponent_id = team_ids[(index + 1) % count]
+        return opponent_id
 
     def _generate_default_plan(self, team_id: str, opponent_id: str, week: int) -> WeeklyGameplan:
         seed = f"plan-{team_id}-{opponent_id}-{week}"
@@ -443,46 +731,29 @@ class GameplanRepository:
             blitz_rate=rng.randrange(18, 34),
             zone_rate=rng.randrange(50, 71),
         )
-        situations = [
-            SituationTendency(
-                bucket=base[0],
-                primary_call=base[1],
-                secondary_call=base[2],
-                notes="Exploit linebackers" if "3rd" in base[0] else "",
-            )
-            for base in _DEFAULT_SITUATIONS
-        ]
         notes = "Blend of balanced run-pass with selective pressure."
         return WeeklyGameplan(
             team_id=team_id,
             opponent_id=opponent_id,
             week=week,
             tendencies=tendencies,
-            situations=situations,
+            situations=list(_DEFAULT_SITUATION_TENDENCIES),
             notes=notes,
         )
 
 
 class _DeterministicRandom:
-    """Helper around Python's random for deterministic but lightweight values."""
+    """Seeded ``random.Random`` wrapper so plans and reports are stable across runs."""
 
     def __init__(self, seed: str) -> None:
-        self._seed = seed
-
-    def _value(self, extra: str) -> int:
-        return abs(hash(f"{self._seed}:{extra}"))
-
-    def randrange(self, start: int, stop: int) -> int:
-        rng = self._value(str(start ^ stop))
-        span = max(stop - start, 1)
-        return start + (rng % span)
+        # blake2b rather than hash(): str hashing is salted per process.
+        self._rng = random.Random(hashlib.blake2b(seed.encode("utf-8"), digest_size=8).digest())
+        self.randrange = self._rng.randrange
 
-    def choice(self, options: Iterable[str]) -> str:
-        options = list(options)
+    def choice(self, options: Sequence[str]) -> str:
         if not options:
             return ""
-        rng = self._value("choice")
-        return options[rng % len(options)]
+        return self._rng.choice(options)
 
 
 __all__ = [
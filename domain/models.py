@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from typing import Literal
+import sys
+from typing import Annotated, Literal
 
 from pydantic import (
     BaseModel,
     Field,
-    confloat,
-    conint,
     field_validator,
 )
 
@@ -24,8 +23,18 @@ FootballPosition = Literal[
     "P",
 ]
 
-AttributeRating = conint(ge=0, le=100)
-RouteCoordinate = confloat(ge=-26.5, le=26.5)
+# Shared constrained aliases: pydantic builds one core-schema node per alias
+# instead of synthesising a constrained type at every field reference.
+AttributeRating = Annotated[int, Field(ge=0, le=100)]
+JerseyNumber = Annotated[int, Field(ge=0, le=99)]
+RouteCoordinate = Annotated[float, Field(ge=-26.5, le=26.5)]
+RouteTimestamp = Annotated[float, Field(ge=0)]
+FieldDepth = Annotated[float, Field(ge=0, le=120)]
+YardLine = Annotated[int, Field(ge=0, le=100)]
+YardsToGain = Annotated[float, Field(gt=0, le=99.5)]
+QuarterClock = Annotated[int, Field(ge=0, le=900)]
+PlayClock = Annotated[int, Field(ge=0, le=40)]
+Score = Annotated[int, Field(ge=0)]
 
 
 class Attributes(BaseModel):
@@ -49,7 +58,7 @@ class Player(BaseModel):
     player_id: str = Field(..., description="Unique identifier for the player")
     name: str
     position: FootballPosition
-    jersey_number: conint(ge=0, le=99) = Field(..., description="Uniform jersey number")
+    jersey_number: JerseyNumber = Field(..., description="Uniform jersey number")
     attributes: Attributes
     team_id: str | None = Field(
         default=None, description="Team identifier or None if unattached"
@@ -69,11 +78,11 @@ class Team(BaseModel):
 class RoutePoint(BaseModel):
     """A single waypoint in a player's route."""
 
-    timestamp: confloat(ge=0) = Field(..., description="Seconds elapsed from snap")
+    timestamp: RouteTimestamp = Field(..., description="Seconds elapsed from snap")
     x: RouteCoordinate = Field(
         ..., description="Horizontal position (yards) from center of the field"
     )
-    y: confloat(ge=0, le=120) = Field(
+    y: FieldDepth = Field(
         ..., description="Vertical position (yards) from own end line"
     )
 
@@ -113,6 +122,14 @@ class Play(BaseModel):
     play_type: Literal["offense", "defense", "special_teams"]
     assignments: list[Assignment] = Field(default_factory=list)
 
+    @field_validator("formation", "personnel")
+    @classmethod
+    def intern_grouping(cls, value: str) -> str:
+        # A handful of formation/personnel labels repeat across every play;
+        # interning shares one string per label and makes equal labels
+        # compare by identity in playbook filters and aggregates.
+        return sys.intern(value)
+
 
 class GameState(BaseModel):
     """Snapshot of in-game context at a particular moment."""
@@ -120,22 +137,22 @@ class GameState(BaseModel):
     game_id: str
     offense_team_id: str
     defense_team_id: str
-    ball_on: conint(ge=0, le=100) = Field(
+    ball_on: YardLine = Field(
         ..., description="Yard line relative to the offense"
     )
     down: Literal[1, 2, 3, 4]
-    yards_to_first: confloat(gt=0, le=99.5)
+    yards_to_first: YardsToGain
     quarter: Literal[1, 2, 3, 4, 5] = Field(
         ..., description="Quarter number; 5 represents overtime"
     )
-    clock_seconds: conint(ge=0, le=900) = Field(
+    clock_seconds: QuarterClock = Field(
         ..., description="Seconds remaining in the current quarter"
     )
-    play_clock: conint(ge=0, le=40) = Field(
+    play_clock: PlayClock = Field(
         ..., description="Seconds remaining on the play clock"
     )
-    score_offense: conint(ge=0) = Field(..., description="Points scored by the offense")
-    score_defense: conint(ge=0) = Field(..., description="Points scored by the defense")
+    score_offense: Score = Field(..., description="Points scored by the offense")
+    score_defense: Score = Field(..., description="Points scored by the defense")
     current_play: Play | None = Field(
         default=None, description="Play currently selected or in progress"
     )
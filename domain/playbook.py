@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
-from collections import Counter
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Literal, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Sequence
 
-from pydantic import ValidationError
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
-from domain.models import Play
+from domain.models import Assignment, Play, RoutePoint
 
 LOGGER = logging.getLogger("domain.playbook")
 
@@ -34,12 +39,13 @@ class PlayValidationError(PlaybookError):
         self.errors = errors
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayMetadata:
     play_id: str
     tags: List[str] = field(default_factory=list)
     version: int = 1
     last_modified: datetime | None = None
+    digest: str | None = None
 
     def to_dict(self) -> Dict[str, object]:
         payload: Dict[str, object] = {
@@ -47,7 +53,11 @@ class PlayMetadata:
             "version": int(self.version),
         }
         if self.last_modified is not None:
-            payload["last_modified"] = self.last_modified.isoformat()
+            # Left as a datetime: orjson writes the same ISO-8601 text as
+            # isoformat() when _persist_metadata encodes the document.
+            payload["last_modified"] = self.last_modified
+        if self.digest is not None:
+            payload["digest"] = self.digest
         return payload
 
     @staticmethod
@@ -62,15 +72,17 @@ class PlayMetadata:
                 last_modified = datetime.fromisoformat(raw_timestamp)
             except ValueError:
                 last_modified = None
+        raw_digest = payload.get("digest")
         return PlayMetadata(
             play_id=play_id,
             tags=tags,
             version=version,
             last_modified=last_modified,
+            digest=raw_digest if isinstance(raw_digest, str) else None,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlayUsage:
     play_id: str
     calls: int = 0
@@ -79,7 +91,7 @@ class PlayUsage:
     last_used: datetime | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlaySummary:
     play_id: str
     name: str
@@ -93,7 +105,7 @@ class PlaySummary:
     last_modified: datetime | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlayFilters:
     formation: Optional[str] = None
     personnel: Optional[str] = None
@@ -101,25 +113,130 @@ class PlayFilters:
     search: Optional[str] = None
 
 
-def _role_requires_route(role: str) -> bool:
-    return role in {"route", "defend", "rush"}
+# Cold listings with at least this many unread files read them on a pool.
+_PARALLEL_READ_MIN = 4
+_PARALLEL_READ_WORKERS = 8
 
+# Built once at import; every play read below validates through it.
+_PLAY_ADAPTER: TypeAdapter[Play] = TypeAdapter(Play)
+
+_ROUTE_ROLES = frozenset({"route", "defend", "rush"})
+# Roles whose counts feed the per-play_type checks in validate_play.
+_COUNTED_ROLES: Dict[str, tuple[str, ...]] = {
+    "offense": ("pass", "carry"),
+    "special_teams": ("kick",),
+    "defense": ("defend", "rush"),
+}
+
+
+def sanitize_error_context(errors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Make pydantic errors JSON-serializable in place (``ctx`` values, raw ``input``)."""
 
-def _sanitize_error_context(errors: List[Dict[str, object]]) -> List[Dict[str, object]]:
-    sanitized: List[Dict[str, object]] = []
     for error in errors:
         ctx = error.get("ctx")
         if isinstance(ctx, dict):
-            error = {**error, "ctx": {key: str(value) for key, value in ctx.items()}}
-        sanitized.append(error)
-    return sanitized
+            error["ctx"] = {key: str(value) for key, value in ctx.items()}
+        raw_input = error.get("input")
+        if isinstance(raw_input, bytes):
+            error["input"] = raw_input.decode("utf-8", errors="replace")
+    return errors
+
+
+def _utcnow() -> datetime:
+    """Naive UTC now, as ``datetime.utcnow()`` returned before its deprecation."""
+
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _play_digest(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _construct_trusted_play(payload: Dict[str, Any]) -> Play:
+    """Materialize a play written by ``save_play`` without re-running validation."""
+
+    assignments = [
+        Assignment.model_construct(
+            player_id=item["player_id"],
+            role=item["role"],
+            route=(
+                [RoutePoint.model_construct(**point) for point in item["route"]]
+                if item.get("route") is not None
+                else None
+            ),
+        )
+        for item in payload.get("assignments", [])
+    ]
+    return Play.model_construct(
+        play_id=payload["play_id"],
+        name=payload["name"],
+        formation=sys.intern(payload["formation"]),
+        personnel=sys.intern(payload["personnel"]),
+        play_type=payload["play_type"],
+        assignments=assignments,
+    )
+
+
+def _check_offense(role_counts: Dict[str, int], errors: List[Dict[str, object]]) -> None:
+    if role_counts["pass"] > 1:
+        errors.append(
+            {
+                "loc": ["assignments"],
+                "msg": "offense play can have at most one 'pass' assignment",
+                "type": "value_error.role_count",
+            }
+        )
+    if role_counts["pass"] + role_counts["carry"] == 0:
+        errors.append(
+            {
+                "loc": ["assignments"],
+                "msg": "offense play requires at least one 'pass' or 'carry' assignment",
+                "type": "value_error.role_required",
+            }
+        )
+
+
+def _check_special_teams(role_counts: Dict[str, int], errors: List[Dict[str, object]]) -> None:
+    if role_counts["kick"] != 1:
+        errors.append(
+            {
+                "loc": ["assignments"],
+                "msg": "special_teams play requires exactly one 'kick' assignment",
+                "type": "value_error.role_required",
+            }
+        )
+
+
+def _check_defense(role_counts: Dict[str, int], errors: List[Dict[str, object]]) -> None:
+    if role_counts["defend"] + role_counts["rush"] == 0:
+        errors.append(
+            {
+                "loc": ["assignments"],
+                "msg": "defense play requires at least one 'defend' or 'rush' assignment",
+                "type": "value_error.role_required",
+            }
+        )
+
+
+# Per-play_type role checks; each reads only the counts named in _COUNTED_ROLES.
+_PLAY_TYPE_CHECKS: Dict[str, Callable[[Dict[str, int], List[Dict[str, object]]], None]] = {
+    "offense": _check_offense,
+    "special_teams": _check_special_teams,
+    "defense": _check_defense,
+}
 
 
 def validate_play(play: Play) -> List[Dict[str, object]]:
     errors: List[Dict[str, object]] = []
     seen_players: set[str] = set()
+    play_type = play.play_type
+    role_counts = dict.fromkeys(_COUNTED_ROLES.get(play_type, ()), 0)
 
     for index, assignment in enumerate(play.assignments):
+        role = assignment.role
+        if role in role_counts:
+            role_counts[role] += 1
+
         if assignment.player_id in seen_players:
             errors.append(
                 {
@@ -131,52 +248,18 @@ def validate_play(play: Play) -> List[Dict[str, object]]:
         else:
             seen_players.add(assignment.player_id)
 
-        if _role_requires_route(assignment.role) and not assignment.route:
+        if role in _ROUTE_ROLES and not assignment.route:
             errors.append(
                 {
                     "loc": ["assignments", index, "route"],
-                    "msg": f"role '{assignment.role}' requires a route",
+                    "msg": f"role '{role}' requires a route",
                     "type": "value_error.route_required",
                 }
             )
 
-    role_counts = Counter(assignment.role for assignment in play.assignments)
-
-    if play.play_type == "offense":
-        if role_counts.get("pass", 0) > 1:
-            errors.append(
-                {
-                    "loc": ["assignments"],
-                    "msg": "offense play can have at most one 'pass' assignment",
-                    "type": "value_error.role_count",
-                }
-            )
-        if role_counts.get("pass", 0) + role_counts.get("carry", 0) == 0:
-            errors.append(
-                {
-                    "loc": ["assignments"],
-                    "msg": "offense play requires at least one 'pass' or 'carry' assignment",
-                    "type": "value_error.role_required",
-                }
-            )
-    elif play.play_type == "special_teams":
-        if role_counts.get("kick", 0) != 1:
-            errors.append(
-                {
-                    "loc": ["assignments"],
-                    "msg": "special_teams play requires exactly one 'kick' assignment",
-                    "type": "value_error.role_required",
-                }
-            )
-    elif play.play_type == "defense":
-        if role_counts.get("defend", 0) + role_counts.get("rush", 0) == 0:
-            errors.append(
-                {
-                    "loc": ["assignments"],
-                    "msg": "defense play requires at least one 'defend' or 'rush' assignment",
-                    "type": "value_error.role_required",
-                }
-            )
+    check = _PLAY_TYPE_CHECKS.get(play_type)
+    if check is not None:
+        check(role_counts, errors)
 
     return errors
 
@@ -224,8 +307,8 @@ class FilePlayUsageProvider(PlayUsageProvider):
         if self._path is None or not self._path.exists():
             return {}
         try:
-            raw = json.loads(self._path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):  # pragma: no cover - defensive
+            raw = orjson.loads(self._path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):  # pragma: no cover - defensive
             return {}
         if isinstance(raw, dict):
             return {
@@ -236,7 +319,10 @@ class FilePlayUsageProvider(PlayUsageProvider):
         return {}
 
     def _fallback_usage(self, play_id: str) -> PlayUsage:
-        seed = abs(hash(play_id))
+        # blake2b rather than hash(): str hashing is salted per process.
+        seed = int.from_bytes(
+            hashlib.blake2b(play_id.encode("utf-8"), digest_size=8).digest(), "little"
+        )
         calls = 6 + seed % 24
         success_rate = 0.35 + (seed % 30) / 100.0
         avg_gain = 3.0 + (seed % 40) * 0.1
@@ -269,7 +355,12 @@ class PlaybookRepository:
             self._usage_provider = FilePlayUsageProvider(usage_path)
         else:
             self._usage_provider = usage_provider
+        self._last_meta_bytes: bytes | None = None
         self._metadata: Dict[str, PlayMetadata] = self._load_metadata()
+        self._play_cache: Dict[Path, tuple[tuple[int, int], Play | None]] = {}
+        self._search_cache: Dict[str, tuple[Play, str]] = {}
+        self._batch_depth = 0
+        self._metadata_dirty = False
 
     # ------------------------------------------------------------------
     # Metadata helpers
@@ -278,10 +369,12 @@ class PlaybookRepository:
         if not self._meta_path.exists():
             return {}
         try:
-            raw = json.loads(self._meta_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError) as exc:  # pragma: no cover - defensive
+            content = self._meta_path.read_bytes()
+            raw = orjson.loads(content)
+        except (OSError, orjson.JSONDecodeError) as exc:  # pragma: no cover - defensive
             LOGGER.warning("Unable to parse playbook metadata: %s", exc)
             return {}
+        self._last_meta_bytes = content
         if not isinstance(raw, dict):
             return {}
         metadata: Dict[str, PlayMetadata] = {}
@@ -290,15 +383,33 @@ class PlaybookRepository:
                 metadata[str(play_id)] = PlayMetadata.from_dict(str(play_id), payload)
         return metadata
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer metadata writes until the outermost ``batch`` block exits."""
+
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._metadata_dirty:
+                self._persist_metadata()
+
     def _persist_metadata(self) -> None:
-        data = {
-            play_id: meta.to_dict()
-            for play_id, meta in sorted(self._metadata.items())
-        }
+        if self._batch_depth:
+            self._metadata_dirty = True
+            return
+        self._metadata_dirty = False
+        data = {play_id: meta.to_dict() for play_id, meta in self._metadata.items()}
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        if content == self._last_meta_bytes:
+            return
         try:
-            self._meta_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            self._meta_path.write_bytes(content)
         except OSError as exc:  # pragma: no cover - defensive
             LOGGER.warning("Unable to persist playbook metadata: %s", exc)
+            return
+        self._last_meta_bytes = content
 
     def _metadata_for(self, play_id: str, *, ensure: bool = False) -> PlayMetadata:
         meta = self._metadata.get(play_id)
@@ -322,38 +433,21 @@ class PlaybookRepository:
         *,
         filters: PlayFilters | None = None,
     ) -> List[PlaySummary]:
-        records: List[tuple[Play, Path, PlayMetadata]] = []
-        for path in sorted(self._plays_dir.glob("*.json")):
-            try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
-            except (OSError, json.JSONDecodeError) as exc:
-                LOGGER.warning("Unable to read play file %s: %s", path, exc)
-                continue
-            try:
-                play = Play.model_validate(payload)
-            except ValidationError as exc:
-                LOGGER.warning("Skipping invalid play file %s: %s", path, exc)
-                continue
-            errors = validate_play(play)
-            if errors:
-                LOGGER.warning("Skipping play %s due to validation errors", play.play_id)
-                continue
+        records: List[tuple[Play, Path, float, PlayMetadata]] = []
+        for play, path, mtime in self._scan_plays():
             if play_type and play.play_type != play_type:
                 continue
             meta = self._metadata_for(play.play_id, ensure=True)
             if filters and not self._match_filters(play, meta, filters):
                 continue
-            records.append((play, path, meta))
+            records.append((play, path, mtime, meta))
 
-        play_ids = [play.play_id for play, _, _ in records]
+        play_ids = [play.play_id for play, _, _, _ in records]
         usage_map = self._usage_provider.stats_for(play_ids) if play_ids else {}
         summaries: List[PlaySummary] = []
-        for play, path, meta in records:
+        for play, path, mtime, meta in records:
             if meta.last_modified is None:
-                try:
-                    meta.last_modified = datetime.fromtimestamp(path.stat().st_mtime)
-                except OSError:
-                    meta.last_modified = None
+                meta.last_modified = datetime.fromtimestamp(mtime)
             usage = usage_map.get(play.play_id, PlayUsage(play.play_id))
             summaries.append(
                 PlaySummary(
@@ -372,28 +466,101 @@ class PlaybookRepository:
         summaries.sort(key=lambda item: (item.play_type, item.name.lower()))
         return summaries
 
+    def _scan_plays(self) -> List[tuple[Play, Path, float]]:
+        """Return ``(play, path, mtime)`` for every valid play file, by file name."""
+
+        with os.scandir(self._plays_dir) as scan:
+            entries = [entry for entry in scan if entry.name.endswith(".json")]
+        entries.sort(key=attrgetter("name"))
+        listed: List[tuple[Path, tuple[int, int], float]] = []
+        for entry in entries:
+            path = Path(entry.path)
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError as exc:
+                LOGGER.warning("Unable to read play file %s: %s", path, exc)
+                continue
+            listed.append((path, (stat.st_mtime_ns, stat.st_size), stat.st_mtime))
+
+        # Unchanged files (same mtime and size) reuse their earlier result,
+        # including a rejection, instead of being parsed again.
+        stale = [
+            (path, signature)
+            for path, signature, _ in listed
+            if (cached := self._play_cache.get(path)) is None or cached[0] != signature
+        ]
+        if len(stale) >= _PARALLEL_READ_MIN:
+            # Overlap the file reads; a cold listing is dominated by disk I/O.
+            with ThreadPoolExecutor(max_workers=min(_PARALLEL_READ_WORKERS, len(stale))) as pool:
+                loaded = list(pool.map(self._read_listed_play, [path for path, _ in stale]))
+        else:
+            loaded = [self._read_listed_play(path) for path, _ in stale]
+        for (path, signature), play in zip(stale, loaded):
+            self._play_cache[path] = (signature, play)
+
+        plays: List[tuple[Play, Path, float]] = []
+        for path, _, mtime in listed:
+            play = self._play_cache[path][1]
+            if play is not None:
+                plays.append((play, path, mtime))
+
+        seen = {path for path, _, _ in listed}
+        for path in self._play_cache.keys() - seen:
+            del self._play_cache[path]
+        return plays
+
+    def _read_listed_play(self, path: Path) -> Play | None:
+        try:
+            raw = path.read_bytes()
+        except OSError as exc:
+            LOGGER.warning("Unable to read play file %s: %s", path, exc)
+            return None
+        # Files whose bytes match the digest recorded by save_play (which
+        # names files after the play id) were validated before they were
+        # written; skip re-validating them.
+        known = self._metadata.get(path.stem)
+        if known is not None and known.digest is not None and known.digest == _play_digest(raw):
+            return _construct_trusted_play(orjson.loads(raw))
+        try:
+            # Parse and validate in one pass inside pydantic-core.
+            play = _PLAY_ADAPTER.validate_json(raw)
+        except ValidationError as exc:
+            LOGGER.warning("Skipping invalid play file %s: %s", path, exc)
+            return None
+        errors = validate_play(play)
+        if errors:
+            LOGGER.warning("Skipping play %s due to validation errors", play.play_id)
+            return None
+        return play
+
     def _match_filters(self, play: Play, meta: PlayMetadata, filters: PlayFilters) -> bool:
+        if filters.tag and filters.tag not in meta.tags:
+            return False
         if filters.formation and play.formation != filters.formation:
             return False
         if filters.personnel and play.personnel != filters.personnel:
             return False
-        if filters.tag and filters.tag not in meta.tags:
-            return False
         if filters.search:
             needle = filters.search.lower()
-            haystack = " ".join(
-                [
-                    play.name,
-                    play.formation,
-                    play.personnel,
-                    play.play_id,
-                    " ".join(meta.tags),
-                ]
-            ).lower()
-            if needle not in haystack:
+            text = self._search_text(play)
+            # Tags are metadata and change independently of the play, so they
+            # are only joined in when the cached play text misses.
+            if needle not in text and needle not in f"{text} {' '.join(meta.tags).lower()}":
                 return False
         return True
 
+    def _search_text(self, play: Play) -> str:
+        # Memoized per Play object; the scan cache hands out a new object
+        # whenever the file changes, which invalidates the entry.
+        cached = self._search_cache.get(play.play_id)
+        if cached is not None and cached[0] is play:
+            return cached[1]
+        text = " ".join([play.name, play.formation, play.personnel, play.play_id]).lower()
+        self._search_cache[play.play_id] = (play, text)
+        return text
+
     # ------------------------------------------------------------------
     # CRUD operations
     # ------------------------------------------------------------------
@@ -402,13 +569,13 @@ class PlaybookRepository:
         if not path.exists():
             raise FileNotFoundError(f"Play '{play_id}' does not exist")
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError) as exc:
+            raw = path.read_bytes()
+        except OSError as exc:
             raise PlaybookError(f"Unable to read play '{play_id}': {exc}") from exc
         try:
-            play = Play.model_validate(payload)
+            play = _PLAY_ADAPTER.validate_json(raw)
         except ValidationError as exc:
-            raise PlayValidationError(_sanitize_error_context(exc.errors())) from exc
+            raise PlayValidationError(sanitize_error_context(exc.errors())) from exc
         errors = validate_play(play)
         if errors:
             raise PlayValidationError(errors)
@@ -426,25 +593,27 @@ class PlaybookRepository:
             metadata.version += 1
         else:
             metadata.version = max(metadata.version, 1)
-        metadata.last_modified = datetime.utcnow()
-        payload = play.model_dump(mode="json")
+        metadata.last_modified = _utcnow()
+        raw = _PLAY_ADAPTER.dump_json(play, indent=2)
         try:
-            path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            path.write_bytes(raw)
         except OSError as exc:
             raise PlaybookError(f"Unable to write play '{play.play_id}': {exc}") from exc
+        metadata.digest = _play_digest(raw)
         self._metadata[play.play_id] = metadata
+        self._play_cache.pop(path, None)
         self._persist_metadata()
         return path
 
     def import_play_file(self, source: Path, *, overwrite: bool = False) -> Play:
         try:
-            payload = json.loads(source.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError) as exc:
+            raw = source.read_bytes()
+        except OSError as exc:
             raise PlaybookError(f"Unable to read play file '{source}': {exc}") from exc
         try:
-            play = Play.model_validate(payload)
+            play = _PLAY_ADAPTER.validate_json(raw)
         except ValidationError as exc:
-            raise PlayValidationError(_sanitize_error_context(exc.errors())) from exc
+            raise PlayValidationError(sanitize_error_context(exc.errors())) from exc
         self.save_play(play, overwrite=overwrite)
         return play
 
@@ -456,8 +625,7 @@ class PlaybookRepository:
         elif dest.suffix.lower() != ".json":
             dest = dest.with_suffix(".json")
         dest.parent.mkdir(parents=True, exist_ok=True)
-        payload = play.model_dump(mode="json")
-        dest.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        dest.write_bytes(_PLAY_ADAPTER.dump_json(play, indent=2))
         return dest
 
     def mirror_play(
@@ -468,7 +636,6 @@ class PlaybookRepository:
         new_name: Optional[str] = None,
     ) -> Play:
         play, _ = self.load_play(play_id)
-        payload = play.model_dump(mode="python", round_trip=True)
         mirrored_id = new_play_id or f"{play.play_id}_flip"
         candidate = mirrored_id
         suffix = 2
@@ -476,29 +643,45 @@ class PlaybookRepository:
             candidate = f"{mirrored_id}_{suffix}"
             suffix += 1
         mirrored_id = candidate
-        payload["play_id"] = mirrored_id
-        payload["name"] = new_name or f"{play.name} (Flip)"
-        for assignment in payload.get("assignments", []):
-            route = assignment.get("route")
-            if isinstance(route, list):
-                for point in route:
-                    if isinstance(point, dict) and "x" in point:
-                        point["x"] = -float(point["x"])
-        mirrored = Play.model_validate(payload)
-        self.save_play(mirrored, overwrite=False)
-        meta = self._metadata_for(mirrored.play_id, ensure=True)
-        if "Mirrored" not in meta.tags:
-            meta.tags.append("Mirrored")
-            meta.tags = sorted(set(meta.tags))
-        self._metadata[mirrored.play_id] = meta
-        self._persist_metadata()
+        # The source play is validated and the x bounds are symmetric, so the
+        # flipped copy is built without another validation pass.
+        assignments = [
+            assignment.model_copy(
+                update={
+                    "route": [
+                        point.model_copy(update={"x": -point.x}) for point in assignment.route
+                    ]
+                }
+            )
+            if assignment.route
+            else assignment.model_copy()
+            for assignment in play.assignments
+        ]
+        mirrored = play.model_copy(
+            update={
+                "play_id": mirrored_id,
+                "name": new_name or f"{play.name} (Flip)",
+                "assignments": assignments,
+            }
+        )
+        with self.batch():
+            self.save_play(mirrored, overwrite=False)
+            meta = self._metadata_for(mirrored.play_id, ensure=True)
+            if "Mirrored" not in meta.tags:
+                meta.tags.append("Mirrored")
+                meta.tags = sorted(set(meta.tags))
+            self._metadata[mirrored.play_id] = meta
+            self._persist_metadata()
         return mirrored
 
     def update_tags(self, play_id: str, tags: Iterable[str]) -> PlayMetadata:
-        metadata = self._metadata_for(play_id, ensure=True)
+        existing = self._metadata.get(play_id)
         cleaned = sorted({tag.strip() for tag in tags if tag.strip()})
+        if existing is not None and existing.tags == cleaned:
+            return existing
+        metadata = self._metadata_for(play_id, ensure=True)
         metadata.tags = cleaned
-        metadata.last_modified = datetime.utcnow()
+        metadata.last_modified = _utcnow()
         self._metadata[play_id] = metadata
         self._persist_metadata()
         return metadata
@@ -506,7 +689,7 @@ class PlaybookRepository:
     def bump_version(self, play_id: str) -> PlayMetadata:
         metadata = self._metadata_for(play_id, ensure=True)
         metadata.version += 1
-        metadata.last_modified = datetime.utcnow()
+        metadata.last_modified = _utcnow()
         self._metadata[play_id] = metadata
         self._persist_metadata()
         return metadata
@@ -520,17 +703,20 @@ class PlaybookRepository:
             tags.update(meta.tags)
         return sorted(tags)
 
-    def available_formations(self) -> List[str]:
+    def aggregates(self) -> tuple[List[str], List[str], List[str]]:
+        """Return sorted tags, formations and personnel from a single scan."""
         formations: set[str] = set()
-        for summary in self.list_plays():
-            formations.add(summary.formation)
-        return sorted(formations)
+        personnel: set[str] = set()
+        for play, _, _ in self._scan_plays():
+            formations.add(play.formation)
+            personnel.add(play.personnel)
+        return self.available_tags(), sorted(formations), sorted(personnel)
+
+    def available_formations(self) -> List[str]:
+        return self.aggregates()[1]
 
     def available_personnel(self) -> List[str]:
-        personnel: set[str] = set()
-        for summary in self.list_plays():
-            personnel.add(summary.personnel)
-        return sorted(personnel)
+        return self.aggregates()[2]
 
 
 __all__ = [
@@ -544,5 +730,6 @@ __all__ = [
     "PlaybookError",
     "PlayAlreadyExistsError",
     "PlayValidationError",
+    "sanitize_error_context",
     "validate_play",
 ]
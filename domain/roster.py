@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-import json
 import logging
+from collections import Counter
 from dataclasses import dataclass
+from itertools import cycle
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import orjson
+from sqlalchemy import bindparam
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select
 
@@ -30,8 +34,20 @@ MIN_POSITION_REQUIREMENTS: Dict[PositionEnum, int] = {
 
 TARGET_ROSTER_SIZE = 53
 
+# Column-only reads: rows come back as plain tuples, with no ORM objects.
+_STMT_ROSTER = select(
+    PlayerRow.player_id,
+    PlayerRow.name,
+    PlayerRow.position,
+    PlayerRow.jersey_number,
+    PlayerRow.overall,
+).where(PlayerRow.team_id == bindparam("team_id"))
+_STMT_DEPTH_CHART = select(DepthChartRow.unit, DepthChartRow.role, DepthChartRow.player_id).where(
+    DepthChartRow.team_id == bindparam("team_id")
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RosterPlayer:
     player_id: str
     name: str
@@ -59,7 +75,7 @@ class RosterPlayer:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DepthSlot:
     slot_id: int
     unit: DepthUnitEnum
@@ -115,6 +131,10 @@ class RosterRepository:
         base = user_home or Path.home()
         self._fallback_path = base / "settings" / "rosters.json"
         self._fallback_path.parent.mkdir(parents=True, exist_ok=True)
+        # Parsed fallback document plus the (mtime_ns, size) it was read at;
+        # rosters are decoded to RosterPlayer lazily, one team at a time.
+        self._fallback_data: Dict[str, List[Any]] = {}
+        self._fallback_signature: Tuple[int, int] | None = None
 
     def _session(self) -> Session:
         return Session(self._engine, expire_on_commit=False)
@@ -125,26 +145,24 @@ class RosterRepository:
     def list_players(self, team_id: str) -> List[RosterPlayer]:
         fallback = self._load_fallback_roster(team_id)
         if fallback:
-            return [RosterPlayer.from_dict(player) for player in fallback]
+            return fallback
 
         try:
-            with self._session() as session:
-                rows = session.exec(select(PlayerRow).where(PlayerRow.team_id == team_id)).all()
+            with self._engine.connect() as connection:
+                rows = connection.execute(_STMT_ROSTER, {"team_id": team_id}).all()
         except SQLAlchemyError as exc:  # pragma: no cover - defensive
             LOGGER.warning("Unable to load roster for %s: %s", team_id, exc)
             rows = []
 
         players: List[RosterPlayer] = []
-        for row in rows:
-            attrs = row.attributes or {}
-            overall = int(sum(attrs.values()) / len(attrs)) if attrs else 60
+        for player_id, name, position, jersey_number, overall in rows:
             players.append(
                 RosterPlayer(
-                    player_id=row.player_id,
-                    name=row.name,
-                    position=row.position,
-                    jersey_number=row.jersey_number,
-                    overall=overall,
+                    player_id=player_id,
+                    name=name,
+                    position=position,
+                    jersey_number=jersey_number,
+                    overall=overall if overall is not None else 60,
                 )
             )
 
@@ -156,64 +174,77 @@ class RosterRepository:
 
     def save_roster(self, team_id: str, players: Iterable[RosterPlayer]) -> None:
         data = self._load_fallback_data()
-        data[team_id] = [player.to_dict() for player in players]
+        # orjson encodes the dataclasses (and their str enums) natively, giving
+        # the same document as to_dict() without building it in Python.
+        data[team_id] = list(players)
         try:
-            self._fallback_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            self._fallback_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            self._fallback_signature = self._fallback_stat()
         except OSError:  # pragma: no cover
             LOGGER.warning("Unable to write roster fallback file")
 
-    def _load_fallback_data(self) -> Dict[str, List[Dict[str, object]]]:
-        if not self._fallback_path.exists():
-            return {}
+    def _fallback_stat(self) -> Tuple[int, int] | None:
         try:
-            return json.loads(self._fallback_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            LOGGER.warning("Malformed roster fallback; resetting")
-            return {}
-
-    def _load_fallback_roster(self, team_id: str) -> List[Dict[str, object]]:
-        return self._load_fallback_data().get(team_id, [])
+            stat = self._fallback_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_fallback_data(self) -> Dict[str, List[Any]]:
+        signature = self._fallback_stat()
+        if signature is not None and signature == self._fallback_signature:
+            return self._fallback_data
+        data: Dict[str, List[Any]] = {}
+        if signature is not None:
+            try:
+                data = orjson.loads(self._fallback_path.read_bytes())
+            except orjson.JSONDecodeError:
+                LOGGER.warning("Malformed roster fallback; resetting")
+        self._fallback_data = data
+        self._fallback_signature = signature
+        return data
+
+    def _load_fallback_roster(self, team_id: str) -> List[RosterPlayer]:
+        data = self._load_fallback_data()
+        roster = data.get(team_id)
+        if not roster:
+            return []
+        if not isinstance(roster[0], RosterPlayer):
+            roster = data[team_id] = [RosterPlayer.from_dict(player) for player in roster]
+        return list(roster)
 
     def _generate_fallback_players(self, team_id: str) -> List[RosterPlayer]:
-        players: List[RosterPlayer] = []
         jersey_seed = abs(hash(team_id)) % 50
-        positions = list(MIN_POSITION_REQUIREMENTS.keys())
+        # Positions repeat in MIN_POSITION_REQUIREMENTS order, as (enum, code).
+        rotation = cycle([(position, position.value) for position in MIN_POSITION_REQUIREMENTS])
         total_needed = max(TARGET_ROSTER_SIZE, sum(MIN_POSITION_REQUIREMENTS.values()))
-        for idx in range(total_needed):
-            position = positions[idx % len(positions)]
-            player_id = f"{team_id}_{position.value}_{idx}"
-            name = f"{position.value} Reserve {idx + 1}"
-            jersey_number = ((jersey_seed + idx * 3) % 90) + 1
-            overall = 65 + (idx % 10) * 2
-            players.append(
-                RosterPlayer(
-                    player_id=player_id,
-                    name=name,
-                    position=position,
-                    jersey_number=jersey_number,
-                    overall=min(overall, 90),
-                )
+        return [
+            RosterPlayer(
+                player_id=f"{team_id}_{code}_{idx}",
+                name=f"{code} Reserve {idx + 1}",
+                position=position,
+                jersey_number=((jersey_seed + idx * 3) % 90) + 1,
+                overall=min(65 + (idx % 10) * 2, 90),
             )
-        return players[:TARGET_ROSTER_SIZE]
+            for idx, (position, code) in zip(range(min(total_needed, TARGET_ROSTER_SIZE)), rotation)
+        ]
 
     # ------------------------------------------------------------------
     # Depth chart helpers
     # ------------------------------------------------------------------
     def load_depth_chart(self, team_id: str) -> List[DepthSlot]:
         template = DEPTH_CHART_TEMPLATE
-        existing: Dict[Tuple[DepthUnitEnum, str], DepthChartRow] = {}
+        existing: Dict[Tuple[str, str], str | None] = {}
         try:
-            with self._session() as session:
-                rows = session.exec(select(DepthChartRow).where(DepthChartRow.team_id == team_id)).all()
-                for row in rows:
-                    existing[(row.unit, row.role)] = row
+            with self._engine.connect() as connection:
+                rows = connection.execute(_STMT_DEPTH_CHART, {"team_id": team_id})
+                existing = {(unit, role): player_id for unit, role, player_id in rows}
         except SQLAlchemyError as exc:  # pragma: no cover - defensive
             LOGGER.warning("Unable to load depth chart for %s: %s", team_id, exc)
         slots: List[DepthSlot] = []
         slot_id = 0
         for unit, entries in template.items():
             for role, position, index in entries:
-                match = existing.get((unit, role))
                 slots.append(
                     DepthSlot(
                         slot_id=slot_id,
@@ -221,7 +252,7 @@ class RosterRepository:
                         role=role,
                         position=position,
                         slot_index=index,
-                        player_id=match.player_id if match else None,
+                        player_id=existing.get((unit, role)),
                     )
                 )
                 slot_id += 1
@@ -230,14 +261,13 @@ class RosterRepository:
     def save_depth_chart(self, team_id: str, assignments: Iterable[DepthSlot]) -> None:
         try:
             with self._session() as session:
+                # One query for the team's existing slots; updates and inserts
+                # are then flushed together at commit.
+                rows = session.exec(select(DepthChartRow).where(DepthChartRow.team_id == team_id)).all()
+                existing = {(row.unit, row.role): row for row in rows}
+                new_rows: List[DepthChartRow] = []
                 for slot in assignments:
-                    row = session.exec(
-                        select(DepthChartRow).where(
-                            DepthChartRow.team_id == team_id,
-                            DepthChartRow.unit == slot.unit,
-                            DepthChartRow.role == slot.role,
-                        )
-                    ).one_or_none()
+                    row = existing.get((slot.unit, slot.role))
                     if row is None:
                         row = DepthChartRow(
                             team_id=team_id,
@@ -247,10 +277,11 @@ class RosterRepository:
                             slot_index=slot.slot_index,
                             player_id=slot.player_id,
                         )
-                        session.add(row)
+                        existing[(slot.unit, slot.role)] = row
+                        new_rows.append(row)
                     else:
                         row.player_id = slot.player_id
-                    session.add(row)
+                session.add_all(new_rows)
                 session.commit()
         except SQLAlchemyError as exc:  # pragma: no cover - defensive
             LOGGER.warning("Unable to save depth chart for %s: %s", team_id, exc)
@@ -278,17 +309,21 @@ class RosterRepository:
         warnings: List[str] = []
         if len(players) != TARGET_ROSTER_SIZE:
             warnings.append(f"Roster size is {len(players)}; target is {TARGET_ROSTER_SIZE} players.")
-        counts: Dict[PositionEnum, int] = {pos: 0 for pos in PositionEnum}
-        for player in players:
-            counts[player.position] += 1
+        counts = Counter(map(attrgetter("position"), players))
         for position, minimum in MIN_POSITION_REQUIREMENTS.items():
-            if counts.get(position, 0) < minimum:
+            if counts[position] < minimum:
                 warnings.append(
-                    f"Minimum requirement for {position.value} is {minimum}. Currently {counts.get(position, 0)}."
+                    f"Minimum requirement for {position.value} is {minimum}. Currently {counts[position]}."
                 )
-        assigned = [slot.player_id for slot in slots if slot.player_id]
-        if len(set(assigned)) != len(assigned):
-            warnings.append("Some players are assigned to multiple depth slots.")
+        seen: set[str] = set()
+        for slot in slots:
+            player_id = slot.player_id
+            if not player_id:
+                continue
+            if player_id in seen:
+                warnings.append("Some players are assigned to multiple depth slots.")
+                break
+            seen.add(player_id)
         return warnings
 
 
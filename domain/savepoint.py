@@ -1,14 +1,81 @@
 from __future__ import annotations
 
-import json
+import io
+import os
 import shutil
+import sqlite3
+import tarfile
+import tempfile
+import time
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
 from typing import Iterable
 
+import orjson
+import zstandard as zstd
+
 DEFAULT_DB_PATH = Path("gridiron.db")
 DEFAULT_SAVE_DIR = Path("data/savepoints")
 DEFAULT_PLAYS_DIR = Path("data/plays")
+# Savepoints are single tar archives compressed as one zstd stream.
+ARCHIVE_SUFFIX = ".tar.zst"
+ARCHIVE_ZSTD_LEVEL = 3
+_SQLITE_HEADER = b"SQLite format 3\x00"
+
+
+def _copy_file(source: str | Path, destination: str | Path) -> str | Path:
+    """``shutil.copy2`` replacement that lets the kernel copy the bytes.
+
+    ``os.copy_file_range`` copies inside the kernel and can share extents
+    (reflink) on filesystems such as btrfs and XFS. Platforms or filesystem
+    pairs that do not support it fall back to ``shutil.copyfile``.
+    """
+
+    copy_range = getattr(os, "copy_file_range", None)
+    copied = False
+    if copy_range is not None:
+        try:
+            with open(source, "rb") as src, open(destination, "wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    written = copy_range(src.fileno(), dst.fileno(), remaining)
+                    if written == 0:
+                        break
+                    remaining -= written
+                copied = remaining == 0
+        except OSError:
+            copied = False
+    if not copied:
+        shutil.copyfile(source, destination)
+    shutil.copystat(source, destination)
+    return destination
+
+
+def _is_sqlite_file(path: Path) -> bool:
+    # SQLite treats a zero-length file as an empty database.
+    with path.open("rb") as handle:
+        header = handle.read(len(_SQLITE_HEADER))
+    return header in (b"", _SQLITE_HEADER)
+
+
+def _copy_database(source: Path, destination: Path) -> None:
+    """Copy a SQLite database page by page through SQLite's online backup API.
+
+    The backup takes SQLite's locks, so it is consistent even while the game
+    holds connections to either file; busy or locked errors propagate rather
+    than falling back to a raw copy. Only a source that is not a SQLite file
+    at all is copied byte for byte, and a destination that is not one is
+    replaced.
+    """
+
+    if not _is_sqlite_file(source):
+        shutil.copy2(source, destination)
+        return
+    if destination.exists() and not _is_sqlite_file(destination):
+        destination.unlink()
+    with closing(sqlite3.connect(source)) as src, closing(sqlite3.connect(destination)) as dst:
+        src.backup(dst)
 
 
 def create_savepoint(
@@ -19,41 +86,54 @@ def create_savepoint(
     extra_paths: Iterable[Path] | None = None,
     save_dir: Path = DEFAULT_SAVE_DIR,
 ) -> Path:
-    """Persist the current database (and optional assets) under a named savepoint."""
+    """Persist the current database (and optional assets) as ``<name>.tar.zst``.
+
+    The archive holds the database snapshot, the plays directory and any
+    extra paths under their own names, followed by a ``metadata.json`` member.
+    """
 
-    target = save_dir / name
-    target.mkdir(parents=True, exist_ok=True)
     if not db_path.exists():
         raise FileNotFoundError(f"Database file not found: {db_path}")
-    shutil.copy2(db_path, target / db_path.name)
+    save_dir.mkdir(parents=True, exist_ok=True)
+    target = save_dir / f"{name}{ARCHIVE_SUFFIX}"
+    partial = target.with_name(f"{target.name}.partial")
 
     copied = []
-    if plays_path and plays_path.exists():
-        destination = target / plays_path.name
-        if destination.exists():
-            shutil.rmtree(destination)
-        shutil.copytree(plays_path, destination)
-        copied.append(str(plays_path.name))
-
-    for extra in extra_paths or []:
-        if not extra.exists():
-            continue
-        destination = target / extra.name
-        if extra.is_dir():
-            if destination.exists():
-                shutil.rmtree(destination)
-            shutil.copytree(extra, destination)
-        else:
-            shutil.copy2(extra, destination)
-        copied.append(extra.name)
-
-    metadata = {
-        "name": name,
-        "created_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
-        "db_file": db_path.name,
-        "copied_assets": copied,
-    }
-    (target / "metadata.json").write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    try:
+        with tempfile.TemporaryDirectory() as scratch, partial.open("wb") as raw:
+            compressor = zstd.ZstdCompressor(level=ARCHIVE_ZSTD_LEVEL)
+            with compressor.stream_writer(raw, closefd=False) as stream, tarfile.open(
+                fileobj=stream, mode="w|"
+            ) as archive:
+                snapshot = Path(scratch) / db_path.name
+                _copy_database(db_path, snapshot)
+                archive.add(snapshot, arcname=db_path.name)
+
+                if plays_path and plays_path.exists():
+                    archive.add(plays_path, arcname=plays_path.name)
+                    copied.append(str(plays_path.name))
+
+                for extra in extra_paths or []:
+                    if not extra.exists():
+                        continue
+                    archive.add(extra, arcname=extra.name)
+                    copied.append(extra.name)
+
+                metadata = {
+                    "name": name,
+                    "created_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+                    "db_file": db_path.name,
+                    "copied_assets": copied,
+                }
+                payload = orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+                info = tarfile.TarInfo("metadata.json")
+                info.size = len(payload)
+                info.mtime = int(time.time())
+                archive.addfile(info, io.BytesIO(payload))
+        os.replace(partial, target)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
     return target
 
 
@@ -64,21 +144,64 @@ def load_savepoint(
     plays_path: Path | None = DEFAULT_PLAYS_DIR,
     save_dir: Path = DEFAULT_SAVE_DIR,
 ) -> None:
-    """Restore the database (and optional assets) from a named savepoint."""
+    """Restore the database (and optional assets) from a named savepoint.
+
+    Reads ``<name>.tar.zst`` archives and, for older saves, ``<name>/``
+    directories.
+    """
+
+    archive_path = save_dir / f"{name}{ARCHIVE_SUFFIX}"
+    if archive_path.exists():
+        wanted = {db_path.name}
+        if plays_path:
+            wanted.add(plays_path.name)
+        with tempfile.TemporaryDirectory() as scratch:
+            with archive_path.open("rb") as raw, zstd.ZstdDecompressor().stream_reader(
+                raw
+            ) as stream, tarfile.open(fileobj=stream, mode="r|") as archive:
+                # A stream can only be read forward, so members are filtered
+                # as they go by; metadata and extra assets are skipped.
+                members = (member for member in archive if member.name.split("/", 1)[0] in wanted)
+                if hasattr(tarfile, "data_filter"):
+                    archive.extractall(scratch, members=members, filter="data")
+                else:  # pragma: no cover - Python 3.11.0-3.11.3 lack extraction filters
+                    archive.extractall(scratch, members=(m for m in members if _is_plain_member(m)))
+            _restore_from_directory(Path(scratch), name, db_path=db_path, plays_path=plays_path)
+        return
 
     source = save_dir / name
     if not source.exists():
         raise FileNotFoundError(f"Savepoint '{name}' not found in {save_dir}")
+    _restore_from_directory(source, name, db_path=db_path, plays_path=plays_path)
+
+
+def _is_plain_member(member: tarfile.TarInfo) -> bool:
+    """Stand-in for the ``data`` filter: regular files and directories that stay inside the target."""
 
-    db_file = next((child for child in source.iterdir() if child.name == db_path.name), None)
-    if not db_file:
+    path = Path(member.name)
+    if path.is_absolute() or ".." in path.parts:
+        return False
+    if not (member.isfile() or member.isdir()):
+        return False
+    member.mode &= 0o755
+    return True
+
+
+def _restore_from_directory(
+    source: Path,
+    name: str,
+    *,
+    db_path: Path,
+    plays_path: Path | None,
+) -> None:
+    db_file = source / db_path.name
+    if not db_file.is_file():
         raise FileNotFoundError(f"Savepoint '{name}' missing database snapshot {db_path.name}")
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(db_file, db_path)
+    _copy_database(db_file, db_path)
 
-    plays_snapshot = source / (plays_path.name if plays_path else "") if plays_path else None
+    plays_snapshot = source / plays_path.name if plays_path else None
     if plays_path and plays_snapshot and plays_snapshot.exists():
         if plays_path.exists():
             shutil.rmtree(plays_path)
-        shutil.copytree(plays_snapshot, plays_path)
-
+        shutil.copytree(plays_snapshot, plays_path, copy_function=_copy_file)
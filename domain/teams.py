@@ -4,6 +4,7 @@ import logging
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional
 
+from sqlalchemy import literal_column
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select
 
@@ -93,6 +94,19 @@ class TeamRepository:
             for item in TEAM_DEFINITIONS
         ]
 
+    def team_ids(self) -> tuple[str, ...]:
+        """Return team ids in ``list_teams`` order without loading whole rows."""
+
+        try:
+            with Session(engine) as session:
+                # rowid order matches the plain table scan behind list_teams.
+                ids = session.exec(select(TeamRow.team_id).order_by(literal_column("rowid"))).all()
+            if ids:
+                return tuple(ids)
+        except SQLAlchemyError as exc:  # pragma: no cover - defensive
+            LOGGER.warning("Unable to load team ids from database: %s", exc)
+        return tuple(item["team_id"] for item in TEAM_DEFINITIONS)
+
     def _team_from_db(self, team_id: str) -> Optional[TeamInfo]:
         try:
             with Session(engine) as session:
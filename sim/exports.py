@@ -13,8 +13,7 @@ def export_standings(result: SeasonResult, path: Path) -> None:
     with path.open("w", newline="", encoding="utf-8") as handle:
         writer = csv.writer(handle)
         writer.writerow(["team_id", "wins", "losses"])
-        for team_id, wins, losses in result.standings:
-            writer.writerow([team_id, wins, losses])
+        writer.writerows(result.standings)
 
 
 def export_team_stats(result: SeasonResult, path: Path) -> None:
@@ -25,9 +24,11 @@ def export_team_stats(result: SeasonResult, path: Path) -> None:
         writer.writerow(header)
         for team_id, book in result.team_books.items():
             box = book.boxscore()
-            for phase, stats in box.get("teams", {}).items():
-                for metric, value in stats.items():
-                    writer.writerow([team_id, phase, metric, value])
+            writer.writerows(
+                (team_id, phase, metric, value)
+                for phase, stats in box.get("teams", {}).items()
+                for metric, value in stats.items()
+            )
 
 
 def export_player_stats(result: SeasonResult, path: Path) -> None:
@@ -38,9 +39,11 @@ def export_player_stats(result: SeasonResult, path: Path) -> None:
         writer.writerow(header)
         for team_id, book in result.team_books.items():
             box = book.boxscore()
-            for player_id, stats in box.get("players", {}).items():
-                for metric, value in stats.items():
-                    writer.writerow([team_id, player_id, metric, value])
+            writer.writerows(
+                (team_id, player_id, metric, value)
+                for player_id, stats in box.get("players", {}).items()
+                for metric, value in stats.items()
+            )
 
 
 def export_injuries(result: SeasonResult, path: Path) -> None:
@@ -51,3 +51,131 @@ def test_session_context_manager_commits_and_queries(tmp_path, monkeypatch) -> N
         result = session.exec(select(db.TeamRow)).all()
 
     assert [team.team_id for team in result] == ["HOME"]
+
+
+def test_create_all_skips_ddl_when_schema_version_matches(tmp_path, monkeypatch) -> None:
+    test_engine = create_engine(
+        f"sqlite:///{tmp_path / 'gridiron-schema.db'}", connect_args={"check_same_thread": False}
+    )
+    monkeypatch.setattr(db, "engine", test_engine, raising=False)
+
+    db.create_all()
+    with db.get_session() as session:
+        stored = session.get(db.AppSettingRow, "schema_version")
+    assert stored is not None and stored.value == str(db.SCHEMA_VERSION)
+
+    def _fail(*_args, **_kwargs) -> None:
+        raise AssertionError("DDL should not run on a current schema")
+
+    monkeypatch.setattr(db.SQLModel.metadata, "create_all", _fail)
+    db.create_all()
+    monkeypatch.setattr(db, "_schema_ready_engine", None)
+    db.create_all()
+
+
+def test_create_all_checks_schema_once_per_engine(tmp_path, monkeypatch) -> None:
+    test_engine = create_engine(
+        f"sqlite:///{tmp_path / 'gridiron-guard.db'}", connect_args={"check_same_thread": False}
+    )
+    monkeypatch.setattr(db, "engine", test_engine, raising=False)
+    calls = []
+    original = db._schema_is_current
+    monkeypatch.setattr(db, "_schema_is_current", lambda: calls.append(1) or original())
+
+    db.create_all()
+    db.create_all()
+
+    assert len(calls) == 1
+
+
+def test_create_all_adds_indexes_to_existing_tables(tmp_path, monkeypatch) -> None:
+    test_engine = create_engine(
+        f"sqlite:///{tmp_path / 'gridiron-legacy.db'}", connect_args={"check_same_thread": False}
+    )
+    monkeypatch.setattr(db, "engine", test_engine, raising=False)
+    db.create_all()
+    with test_engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX ix_gamerow_season_week")
+        connection.exec_driver_sql("DELETE FROM appsettingrow WHERE key = 'schema_version'")
+    monkeypatch.setattr(db, "_schema_ready_engine", None)
+
+    db.create_all()
+
+    index_names = {index["name"] for index in inspect(test_engine).get_indexes("gamerow")}
+    assert "ix_gamerow_season_week" in index_names
+
+
+def test_position_column_stores_codes_and_reads_legacy_names(tmp_path, monkeypatch) -> None:
+    test_engine = create_engine(
+        f"sqlite:///{tmp_path / 'gridiron-positions.db'}", connect_args={"check_same_thread": False}
+    )
+    monkeypatch.setattr(db, "engine", test_engine, raising=False)
+    db.create_all()
+
+    with db.get_session() as session:
+        session.add(db.PlayerRow(player_id="P1", name="Coded", position=db.PositionEnum.WR, jersey_number=11))
+    with test_engine.begin() as connection:
+        stored = connection.exec_driver_sql("SELECT position FROM playerrow WHERE player_id = 'P1'").scalar_one()
+        connection.exec_driver_sql(
+            "INSERT INTO playerrow (player_id, name, position, jersey_number) VALUES ('P2', 'Legacy', 'QB', 12)"
+        )
+
+    assert stored == 2
+    with db.get_session() as session:
+        positions = {row.player_id: row.position for row in session.exec(select(db.PlayerRow)).all()}
+    assert positions == {"P1": db.PositionEnum.WR, "P2": db.PositionEnum.QB}
+
+
+def test_create_all_adds_and_backfills_player_overall(tmp_path, monkeypatch) -> None:
+    test_engine = create_engine(
+        f"sqlite:///{tmp_path / 'gridiron-overall.db'}", connect_args={"check_same_thread": False}
+    )
+    monkeypatch.setattr(db, "engine", test_engine, raising=False)
+    db.create_all()
+    with test_engine.begin() as connection:
+        connection.exec_driver_sql("ALTER TABLE playerrow DROP COLUMN overall")
+        connection.exec_driver_sql(
+            "INSERT INTO playerrow (player_id, name, position, jersey_number, attributes) "
+            "VALUES ('P1', 'Legacy', 0, 12, '{\"speed\": 71, \"awareness\": 90}')"
+        )
+        connection.exec_driver_sql("DELETE FROM appsettingrow WHERE key = 'schema_version'")
+    monkeypatch.setattr(db, "_schema_ready_engine", None)
+
+    db.create_all()
+
+    with db.get_session() as session:
+        legacy = session.get(db.PlayerRow, "P1")
+        assert legacy.overall == 80
+        session.add(
+            db.PlayerRow(player_id="P2", name="New", position=db.PositionEnum.K, jersey_number=3, attributes={"kick": 77})
+        )
+    with db.get_session() as session:
+        assert session.get(db.PlayerRow, "P2").overall == 77
+
+
+def test_create_all_migrates_legacy_position_names(tmp_path, monkeypatch) -> None:
+    test_engine = create_engine(
+        f"sqlite:///{tmp_path / 'gridiron-legacy-positions.db'}", connect_args={"check_same_thread": False}
+    )
+    monkeypatch.setattr(db, "engine", test_engine, raising=False)
+    db.create_all()
+    with test_engine.begin() as connection:
+        connection.exec_driver_sql("INSERT INTO teamrow (team_id, name, city, abbreviation) VALUES ('T1', 'T', 'C', 'T1')")
+        connection.exec_driver_sql(
+            "INSERT INTO playerrow (player_id, name, position, jersey_number) VALUES ('P1', 'Legacy', 'QB', 12)"
+        )
+        connection.exec_driver_sql(
+            "INSERT INTO depthchartrow (team_id, unit, role, position, slot_index, player_id) "
+            "VALUES ('T1', 'offense', 'QB1', 'S', 0, 'P1')"
+        )
+        connection.exec_driver_sql("DELETE FROM appsettingrow WHERE key = 'schema_version'")
+    monkeypatch.setattr(db, "_schema_ready_engine", None)
+
+    db.create_all()
+
+    with test_engine.connect() as connection:
+        player_position = connection.exec_driver_sql("SELECT position FROM playerrow").scalar_one()
+        depth_position = connection.exec_driver_sql("SELECT position FROM depthchartrow").scalar_one()
+    assert (player_position, depth_position) == (0, 8)
+    with db.get_session() as session:
+        assert session.get(db.PlayerRow, "P1").position == db.PositionEnum.QB
@@ -21,6 +21,9 @@ class DummyTeamRepository:
     def list_teams(self) -> list[TeamInfo]:
         return list(self._teams)
 
+    def team_ids(self) -> tuple[str, ...]:
+        return tuple(team.team_id for team in self._teams)
+
     def find_team(self, team_id: str, *, fallbacks: bool = True) -> TeamInfo | None:  # noqa: ARG002 - fallbacks unused
         for team in self._teams:
             if team.team_id == team_id:
@@ -81,3 +84,169 @@ def test_gameplan_repository_records_execution(tmp_path: Path) -> None:
     reloaded = repo.load_plan("TST", week=2)
     assert reloaded.last_execution is not None
     assert reloaded.last_execution.actual["zone_rate"] == 63.0
+
+
+def test_gameplan_repository_lists_saved_plans_after_reload(tmp_path: Path) -> None:
+    home = tmp_path / "home"
+    repo = GameplanRepository(home, team_repository=DummyTeamRepository())
+    repo.load_plan("TST", week=2)
+    repo.load_plan("TST", week=1)
+    repo.load_plan("OPP", week=1)
+
+    reloaded = GameplanRepository(home, team_repository=DummyTeamRepository())
+    plans = reloaded.list_saved_plans("TST")
+    assert [plan.week for plan in plans] == [1, 2]
+    assert all(plan.team_id == "TST" for plan in plans)
+
+
+def test_gameplan_repository_replays_journal_and_compacts(tmp_path: Path) -> None:
+    home = tmp_path / "home"
+    repo = GameplanRepository(home, team_repository=DummyTeamRepository())
+    plan = repo.load_plan("TST", week=5)
+    plan.notes = "Journal entry"
+    repo.save_plan(plan)
+    repo.load_plan("TST", week=6)
+    repo.delete_plan("TST", "OPP", 6)
+
+    settings = home / "settings"
+    assert (settings / "gameplans.log").exists()
+    reloaded = GameplanRepository(home, team_repository=DummyTeamRepository())
+    assert [saved.week for saved in reloaded.list_saved_plans("TST")] == [5]
+    assert reloaded.load_plan("TST", week=5).notes == "Journal entry"
+
+    reloaded.compact()
+    assert not (settings / "gameplans.log").exists()
+    compacted = GameplanRepository(home, team_repository=DummyTeamRepository())
+    assert compacted.load_plan("TST", week=5).notes == "Journal entry"
+
+
+def test_gameplan_save_keeps_last_execution(tmp_path: Path) -> None:
+    home = tmp_path / "home"
+    repo = GameplanRepository(home, team_repository=DummyTeamRepository())
+    plan = repo.load_plan("TST", week=7)
+    repo.record_execution(plan.team_id, plan.opponent_id, plan.week, {"run_rate": 70.0})
+
+    plan = repo.load_plan("TST", week=7)
+    plan.notes = "Edited after the game"
+    repo.save_plan(plan)
+
+    reloaded = GameplanRepository(home, team_repository=DummyTeamRepository()).load_plan("TST", week=7)
+    assert reloaded.notes == "Edited after the game"
+    assert reloaded.last_execution is not None
+    assert reloaded.last_execution.actual["run_rate"] == 70.0
+
+
+def test_gameplan_preview_many_matches_preview(tmp_path: Path) -> None:
+    repo = GameplanRepository(tmp_path / "home", team_repository=DummyTeamRepository())
+    plans = [repo.load_plan("TST", week=week) for week in range(1, 6)]
+    plans[0].tendencies.run_rate = 120
+    plans[1].tendencies.deep_shot_rate = -4
+
+    batched = repo.preview_many(plans, drives=9)
+    assert batched == [repo.preview(plan, drives=9) for plan in plans]
+    assert repo.preview_many([]) == []
+
+
+def test_gameplan_timestamps_store_epoch_seconds_and_read_iso() -> None:
+    from datetime import datetime
+
+    from domain.gameplan import WeeklyGameplan
+
+    plan = WeeklyGameplan(team_id="TST", opponent_id="OPP", week=1, last_modified=datetime(2025, 9, 7, 13, 0, 5))
+    payload = plan.to_dict()
+    assert payload["last_modified"] == 1757250005
+    assert WeeklyGameplan.from_dict(payload).last_modified == datetime(2025, 9, 7, 13, 0, 5)
+
+    payload["last_modified"] = "2025-09-07T13:00:05"
+    assert WeeklyGameplan.from_dict(payload).last_modified == datetime(2025, 9, 7, 13, 0, 5)
+
+
+def test_gameplan_save_many_shares_timestamp(tmp_path: Path) -> None:
+    home = tmp_path / "home"
+    repo = GameplanRepository(home, team_repository=DummyTeamRepository())
+    plans = [repo.load_plan("TST", week=week) for week in (8, 9, 10)]
+    for plan in plans:
+        plan.notes = f"Batch week {plan.week}"
+    repo.save_many(plans)
+
+    assert len({plan.last_modified for plan in plans}) == 1
+    reloaded = GameplanRepository(home, team_repository=DummyTeamRepository())
+    assert [plan.notes for plan in reloaded.list_saved_plans("TST")] == [
+        "Batch week 8",
+        "Batch week 9",
+        "Batch week 10",
+    ]
+
+
+def test_gameplan_repository_sees_saves_from_another_instance(tmp_path: Path) -> None:
+    home = tmp_path / "home"
+    reader = GameplanRepository(home, team_repository=DummyTeamRepository())
+    writer = GameplanRepository(home, team_repository=DummyTeamRepository())
+
+    cached = reader.load_plan("TST", opponent_id="OPP", week=3)
+    cached.notes = "Mutated by the caller"
+    assert reader.load_plan("TST", opponent_id="OPP", week=3).notes != "Mutated by the caller"
+
+    plan = writer.load_plan("TST", opponent_id="OPP", week=3)
+    plan.notes = "Saved elsewhere"
+    writer.save_plan(plan)
+    assert reader.load_plan("TST", opponent_id="OPP", week=3).notes == "Saved elsewhere"
+
+    writer.compact()
+    writer.delete_plan("TST", "OPP", 3)
+    assert [saved.week for saved in reader.list_saved_plans("TST")] == []
+
+
+def test_gameplan_compaction_keeps_entries_appended_by_another_instance(tmp_path: Path) -> None:
+    home = tmp_path / "home"
+    first = GameplanRepository(home, team_repository=DummyTeamRepository())
+    second = GameplanRepository(home, team_repository=DummyTeamRepository())
+
+    plan = second.load_plan("TST", opponent_id="OPP", week=4)
+    plan.notes = "Appended by the second instance"
+    second.save_plan(plan)
+    # The first instance compacts without having read the second one's entry.
+    first.compact()
+
+    assert not (home / "settings" / "gameplans.log").exists()
+    reloaded = GameplanRepository(home, team_repository=DummyTeamRepository())
+    assert reloaded.load_plan("TST", opponent_id="OPP", week=4).notes == "Appended by the second instance"
+
+
+def test_gameplan_save_does_not_adopt_a_concurrent_append_unseen(tmp_path: Path) -> None:
+    import threading
+
+    from domain.gameplan import WeeklyGameplan
+
+    home = tmp_path / "home"
+    first = GameplanRepository(home, team_repository=DummyTeamRepository())
+    second = GameplanRepository(home, team_repository=DummyTeamRepository())
+    other_plan = WeeklyGameplan(team_id="T5", opponent_id="OPP", week=1, notes="Saved by the second instance")
+    writer = threading.Thread(target=second.save_plan, args=(other_plan,))
+
+    class InterleavingPlan(WeeklyGameplan):
+        def to_dict(self):
+            # The second repository tries to append while the first one is
+            # between its refresh and its own append.
+            writer.start()
+            writer.join(timeout=0.2)
+            return super().to_dict()
+
+    first.save_plan(InterleavingPlan(team_id="TST", opponent_id="OPP", week=2))
+    writer.join()
+
+    assert [plan.notes for plan in first.list_saved_plans("T5")] == ["Saved by the second instance"]
+    assert [plan.week for plan in first.list_saved_plans("TST")] == [2]
+
+
+def test_gameplan_default_opponent_follows_team_changes(tmp_path: Path) -> None:
+    teams = DummyTeamRepository()
+    teams._teams = []
+    repo = GameplanRepository(tmp_path / "home", team_repository=teams)
+    assert repo.load_plan("TST", week=1).opponent_id == "OPP"
+
+    teams._teams = [
+        TeamInfo(team_id="TST", name="Testers", city="Test City", abbreviation="TST"),
+        TeamInfo(team_id="NEW", name="Newcomers", city="New City", abbreviation="NEW"),
+    ]
+    assert repo.load_plan("TST", week=2).opponent_id == "NEW"
@@ -74,3 +74,14 @@ def test_validate_play_requires_ball_handler_on_offense() -> None:
         "requires at least one 'pass' or 'carry'" in error["msg"]
         for error in body["detail"]
     )
+
+
+def test_validate_play_rejects_malformed_json() -> None:
+    response = client.post(
+        "/play/validate",
+        content=b"{not json",
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"][0]["type"] == "json_invalid"
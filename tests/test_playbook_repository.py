@@ -1,7 +1,13 @@
 import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 
-from domain.playbook import PlaybookRepository
+import pytest
+
+from domain.models import Play
+from domain.playbook import PlaybookRepository, PlayFilters, PlayValidationError
 
 
 def _write_play(path: Path, payload: dict) -> None:
@@ -108,3 +114,180 @@ def test_update_tags_and_mirror(tmp_path: Path) -> None:
     assert any(summary.play_id == "slant_left" for summary in summaries)
 
 
+def test_list_plays_revalidates_externally_edited_files(tmp_path: Path) -> None:
+    plays_dir = tmp_path / "plays"
+    plays_dir.mkdir()
+    repo = PlaybookRepository(plays_dir=plays_dir, user_home=tmp_path / "home")
+    path = repo.save_play(Play.model_validate(_offense_play()))
+
+    trusted = repo.list_plays("offense")
+    assert [summary.play_id for summary in trusted] == ["slant_right"]
+
+    tampered = _offense_play()
+    tampered["assignments"][1]["route"] = None  # route role without a route
+    _write_play(path, tampered)
+
+    reloaded = PlaybookRepository(plays_dir=plays_dir, user_home=tmp_path / "home")
+    assert reloaded.list_plays("offense") == []
+
+
+def test_malformed_play_json_is_reported_as_validation_error(tmp_path: Path) -> None:
+    plays_dir = tmp_path / "plays"
+    plays_dir.mkdir()
+    (plays_dir / "broken.json").write_text("{\"play_id\": ", encoding="utf-8")
+    _write_play(plays_dir / "slant_right.json", _offense_play())
+    repo = PlaybookRepository(plays_dir=plays_dir, user_home=tmp_path / "home")
+
+    assert [summary.play_id for summary in repo.list_plays()] == ["slant_right"]
+    with pytest.raises(PlayValidationError) as excinfo:
+        repo.load_play("broken")
+    assert excinfo.value.errors[0]["type"] == "json_invalid"
+
+
+def test_list_plays_reuses_unchanged_files(tmp_path: Path, monkeypatch) -> None:
+    plays_dir = tmp_path / "plays"
+    plays_dir.mkdir()
+    path = plays_dir / "slant_right.json"
+    _write_play(path, _offense_play())
+    repo = PlaybookRepository(plays_dir=plays_dir, user_home=tmp_path / "home")
+    assert [summary.play_id for summary in repo.list_plays()] == ["slant_right"]
+
+    calls: list[Path] = []
+    original = repo._read_listed_play
+    monkeypatch.setattr(repo, "_read_listed_play", lambda p: calls.append(p) or original(p))
+
+    assert [summary.play_id for summary in repo.list_plays()] == ["slant_right"]
+    assert calls == []
+
+    _write_play(path, _offense_play(name="Slant Right Option"))
+    summaries = repo.list_plays()
+    assert calls == [path]
+    assert summaries[0].name == "Slant Right Option"
+
+    path.unlink()
+    assert repo.list_plays() == []
+    assert repo._play_cache == {}
+
+
+def test_aggregates_share_one_scan(tmp_path: Path) -> None:
+    plays_dir = tmp_path / "plays"
+    plays_dir.mkdir()
+    _write_play(plays_dir / "slant_right.json", _offense_play())
+    _write_play(plays_dir / "cover_two.json", _defense_play())
+    repo = PlaybookRepository(plays_dir=plays_dir, user_home=tmp_path / "home")
+    repo.update_tags("slant_right", ["base"])
+
+    tags, formations, personnel = repo.aggregates()
+    assert tags == ["base"]
+    assert formations == repo.available_formations()
+    assert personnel == repo.available_personnel()
+    assert len(formations) == len({_offense_play()["formation"], _defense_play()["formation"]})
+
+
+def test_batch_defers_metadata_writes(tmp_path: Path) -> None:
+    plays_dir = tmp_path / "plays"
+    plays_dir.mkdir()
+    home = tmp_path / "home"
+    repo = PlaybookRepository(plays_dir=plays_dir, user_home=home)
+    metadata_file = home / "playbooks.json"
+
+    with repo.batch():
+        repo.save_play(Play.model_validate(_offense_play()))
+        repo.save_play(Play.model_validate(_defense_play()))
+        repo.update_tags("slant_right", ["base"])
+        assert not metadata_file.exists()
+
+    data = json.loads(metadata_file.read_text(encoding="utf-8"))
+    assert sorted(data) == ["cover_two", "slant_right"]
+    assert data["slant_right"]["tags"] == ["base"]
+
+
+def test_search_filter_matches_play_text_and_tags(tmp_path: Path) -> None:
+    plays_dir = tmp_path / "plays"
+    plays_dir.mkdir()
+    repo = PlaybookRepository(plays_dir=plays_dir, user_home=tmp_path / "home")
+    repo.save_play(Play.model_validate(_offense_play()))
+    repo.save_play(Play.model_validate(_defense_play()))
+
+    def search(text: str) -> list[str]:
+        return [summary.play_id for summary in repo.list_plays(filters=PlayFilters(search=text))]
+
+    assert search("SLANT") == ["slant_right"]
+    repo.update_tags("cover_two", ["Red Zone"])
+    assert search("red zone") == ["cover_two"]
+
+    renamed = _offense_play(name="Quick Out")
+    repo.save_play(Play.model_validate(renamed), overwrite=True)
+    assert search("slant right") == []
+    assert search("quick") == ["slant_right"]
+
+
+def test_fallback_usage_is_stable_across_processes(tmp_path: Path) -> None:
+    script = (
+        "from domain.playbook import FilePlayUsageProvider\n"
+        "usage = FilePlayUsageProvider(None).stats_for(['slant_right'])['slant_right']\n"
+        "print(usage.calls, usage.success_rate, usage.avg_gain)\n"
+    )
+    root = Path(__file__).resolve().parents[1]
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=root,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1
+
+
+def test_list_plays_reads_many_files_in_parallel(tmp_path: Path) -> None:
+    plays_dir = tmp_path / "plays"
+    plays_dir.mkdir()
+    for index in range(6):
+        _write_play(
+            plays_dir / f"play_{index}.json",
+            _offense_play(play_id=f"play_{index}", name=f"Play {index}"),
+        )
+    (plays_dir / "broken.json").write_text("{", encoding="utf-8")
+    repo = PlaybookRepository(plays_dir=plays_dir, user_home=tmp_path / "home")
+
+    summaries = repo.list_plays()
+    assert [summary.play_id for summary in summaries] == [f"play_{index}" for index in range(6)]
+    assert repo._play_cache[plays_dir.resolve() / "broken.json"][1] is None
+
+
+def test_metadata_timestamps_round_trip(tmp_path: Path) -> None:
+    plays_dir = tmp_path / "plays"
+    plays_dir.mkdir()
+    home = tmp_path / "home"
+    repo = PlaybookRepository(plays_dir=plays_dir, user_home=home)
+    repo.save_play(Play.model_validate(_offense_play()))
+    saved = repo.update_tags("slant_right", ["base"]).last_modified
+
+    data = json.loads((home / "playbooks.json").read_text(encoding="utf-8"))
+    assert data["slant_right"]["last_modified"] == saved.isoformat()
+
+    reloaded = PlaybookRepository(plays_dir=plays_dir, user_home=home)
+    assert reloaded.list_plays()[0].last_modified == saved
+
+
+def test_unchanged_metadata_is_not_rewritten(tmp_path: Path) -> None:
+    plays_dir = tmp_path / "plays"
+    plays_dir.mkdir()
+    home = tmp_path / "home"
+    repo = PlaybookRepository(plays_dir=plays_dir, user_home=home)
+    repo.save_play(Play.model_validate(_offense_play()))
+    first = repo.update_tags("slant_right", ["base", "third_down"])
+    metadata_file = home / "playbooks.json"
+    metadata_file.write_text("sentinel", encoding="utf-8")
+
+    again = repo.update_tags("slant_right", ["third_down", "base "])
+    assert again.last_modified == first.last_modified
+    repo.bump_version("slant_right")
+    assert metadata_file.read_text(encoding="utf-8") != "sentinel"
+    metadata_file.write_text("sentinel", encoding="utf-8")
+    repo._persist_metadata()
+    assert metadata_file.read_text(encoding="utf-8") == "sentinel"
@@ -4,13 +4,14 @@ from pathlib import Path
 
 import base64
 import json
-import zlib
+
+import zstandard as zstd
 
 from fastapi.testclient import TestClient
 from sqlmodel import select
 
 from app.main import app
-from domain.db import PlayerRow, get_session
+from domain.db import BoxScoreRow, GameRow, PlayerRow, get_session
 
 client = TestClient(app)
 
@@ -66,6 +67,8 @@ def test_play_import_and_list_round_trip() -> None:
     assert any(item["play_id"] == play_id for item in plays)
 
     path.unlink(missing_ok=True)
+    relisted = client.get("/play/list").json()
+    assert all(item["play_id"] != play_id for item in relisted)
 
 
 def test_game_simulation_and_stats_endpoints() -> None:
@@ -83,9 +86,20 @@ def test_game_simulation_and_stats_endpoints() -> None:
     assert game_body["game_id"]
     assert game_body["home_score"] >= 0
     assert game_body["away_score"] >= 0
+    assert game_body["drives"]
+    assert set(game_body["drives"][0]) == {
+        "offense",
+        "quarter",
+        "plays",
+        "yards",
+        "duration",
+        "start_yardline",
+        "end_yardline",
+        "result",
+    }
     assert game_body["events_blob"]
     decoded = base64.b64decode(game_body["events_blob"])
-    payload = json.loads(zlib.decompress(decoded).decode("utf-8"))
+    payload = json.loads(zstd.ZstdDecompressor().decompress(decoded).decode("utf-8"))
     assert "home" in payload and "away" in payload
 
     team_stats = client.get("/stats/team/ATX")
@@ -114,6 +128,18 @@ def test_season_run_endpoint_returns_summary() -> None:
     assert summary["standings"]
     assert summary["games"]
 
+    with get_session() as session:
+        games = session.exec(select(GameRow).where(GameRow.season_id == summary["season_id"])).all()
+        team_rows = session.exec(
+            select(BoxScoreRow).where(
+                BoxScoreRow.game_id == summary["games"][0]["game_id"],
+                BoxScoreRow.player_id.is_(None),
+            )
+        ).all()
+    assert len(games) == len(summary["games"])
+    assert len(team_rows) == 2
+    assert (Path("data/exports") / summary["season_id"] / "standings.csv").exists()
+
 
 def test_stats_team_not_found_returns_404() -> None:
     response = client.get("/stats/team/UNKNOWN")
@@ -123,3 +149,108 @@ def test_stats_team_not_found_returns_404() -> None:
 def test_stats_player_not_found_returns_404() -> None:
     response = client.get("/stats/player/UNKNOWN")
     assert response.status_code == 404
+
+
+def test_game_simulation_unknown_team_returns_404(monkeypatch) -> None:
+    import app.api.game as game_api
+
+    plan_loads: list[tuple[str, str, int]] = []
+    monkeypatch.setattr(game_api, "_load_plans", lambda *args: plan_loads.append(args))
+    response = client.post(
+        "/game/simulate",
+        json={"home_team_id": "ATX", "away_team_id": "UNKNOWN", "save": False},
+    )
+    assert response.status_code == 404
+    assert "UNKNOWN" in response.json()["detail"]
+    # No default gameplan is generated (and saved) for a team that does not exist.
+    assert plan_loads == []
+
+
+def test_game_simulation_honours_config_overrides() -> None:
+    response = client.post(
+        "/game/simulate",
+        json={
+            "home_team_id": "ATX",
+            "away_team_id": "BOS",
+            "seed": 7,
+            "save": False,
+            "config": {"max_plays": 20},
+        },
+    )
+    assert response.status_code == 201
+    body = response.json()
+    assert body["game_id"] is None
+    assert body["total_plays"] <= 20
+
+
+def test_season_run_endpoint_parallel_seasons() -> None:
+    response = client.post("/season/run", json={"seed": 91, "seasons": 2, "workers": 2})
+    assert response.status_code == 201
+    seasons = response.json()["seasons"]
+    assert [season["seed"] for season in seasons] == [91, 92]
+    assert all(season["games"] for season in seasons)
+
+
+def test_season_run_maps_simulation_value_errors_to_400(monkeypatch) -> None:
+    import app.api.season as season_api
+
+    def _fail(*_args, **_kwargs):
+        raise ValueError("schedule needs an even number of teams")
+
+    monkeypatch.setattr(season_api, "_simulate_single_season", _fail)
+    response = client.post("/season/run", json={"seed": 5, "seasons": 1, "workers": 1})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "schedule needs an even number of teams"
+
+
+def test_parallel_seasons_keep_at_most_workers_in_flight(monkeypatch) -> None:
+    import app.api.season as season_api
+
+    in_flight: list[int] = []
+    peak = [0]
+
+    class _LazyFuture:
+        def __init__(self, seed: int) -> None:
+            self.seed = seed
+
+        def result(self) -> int:
+            in_flight.remove(self.seed)
+            return self.seed
+
+        def cancel(self) -> bool:
+            return True
+
+    class _Pool:
+        def submit(self, _fn, _rosters, seed, _workers):
+            in_flight.append(seed)
+            peak[0] = max(peak[0], len(in_flight))
+            return _LazyFuture(seed)
+
+    monkeypatch.setattr(season_api, "simulation_pool", lambda: _Pool())
+    results = season_api._simulate_seasons_in_pool({}, [1, 2, 3, 4, 5], 2)
+
+    assert results == [1, 2, 3, 4, 5]
+    assert peak[0] == 2
+
+
+def test_player_stats_count_boolean_flags() -> None:
+    with get_session() as session:
+        game_id = session.exec(select(GameRow.game_id)).first()
+        session.add_all(
+            [
+                BoxScoreRow(
+                    game_id=game_id,
+                    team_id="ATX",
+                    player_id="FLAG-TEST",
+                    stat_type="player",
+                    stat_payload={"tackles": 2, "started": started, "note": "depth"},
+                )
+                for started in (True, False, True)
+            ]
+        )
+
+    response = client.get("/stats/player/FLAG-TEST")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["games"] == 3
+    assert body["totals"] == {"tackles": 6.0, "started": 2.0}
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+from sqlmodel import Session, create_engine, select
+
+import domain.db as db
+from domain.db import PositionEnum
+from domain.roster import DepthSlot, RosterPlayer, RosterRepository
+
+
+def test_save_roster_round_trips_through_fallback_file(tmp_path: Path) -> None:
+    repo = RosterRepository(user_home=tmp_path)
+    players = [
+        RosterPlayer(player_id="BUF_QB_1", name="Starter", position=PositionEnum.QB, jersey_number=12, overall=81),
+        RosterPlayer(player_id="BUF_K_2", name="Kicker", position=PositionEnum.K, jersey_number=3, overall=70),
+    ]
+    repo.save_roster("BUF", players)
+
+    data = json.loads((tmp_path / "settings" / "rosters.json").read_text(encoding="utf-8"))
+    assert data["BUF"] == [player.to_dict() for player in players]
+    assert RosterRepository(user_home=tmp_path).list_players("BUF") == players
+
+
+def test_fallback_document_is_reused_until_the_file_changes(tmp_path: Path, monkeypatch) -> None:
+    repo = RosterRepository(user_home=tmp_path)
+    starter = RosterPlayer(player_id="BUF_QB_1", name="Starter", position=PositionEnum.QB, jersey_number=12, overall=81)
+    repo.save_roster("BUF", [starter])
+
+    reads: list[Path] = []
+    original = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self) or original(self))
+    assert repo.list_players("BUF") == [starter]
+    assert reads == []
+
+    other = RosterRepository(user_home=tmp_path)
+    backup = RosterPlayer(player_id="BUF_QB_2", name="Backup", position=PositionEnum.QB, jersey_number=7, overall=70)
+    other.save_roster("BUF", [starter, backup])
+    assert repo.list_players("BUF") == [starter, backup]
+    assert len(reads) == 2
+
+
+def test_save_depth_chart_updates_existing_slots_in_place(tmp_path: Path, monkeypatch) -> None:
+    test_engine = create_engine(
+        f"sqlite:///{tmp_path / 'depth.db'}", connect_args={"check_same_thread": False}
+    )
+    monkeypatch.setattr(db, "engine", test_engine, raising=False)
+    db.create_all()
+    repo = RosterRepository(user_home=tmp_path)
+    repo._engine = test_engine
+
+    slots = repo.load_depth_chart("BUF")
+    first = [replace(slot, player_id=f"P{slot.slot_id}") for slot in slots]
+    repo.save_depth_chart("BUF", first)
+    second = [replace(slot, player_id=None) if slot.role == "QB1" else slot for slot in first]
+    repo.save_depth_chart("BUF", second)
+
+    with Session(test_engine) as session:
+        rows = session.exec(select(db.DepthChartRow).where(db.DepthChartRow.team_id == "BUF")).all()
+    assert len(rows) == len(slots)
+    reloaded = {slot.role: slot.player_id for slot in repo.load_depth_chart("BUF")}
+    assert reloaded["QB1"] is None
+    assert reloaded["QB2"] == "P1"
+
+
+def test_list_players_reads_database_rows(tmp_path: Path, monkeypatch) -> None:
+    test_engine = create_engine(
+        f"sqlite:///{tmp_path / 'roster.db'}", connect_args={"check_same_thread": False}
+    )
+    monkeypatch.setattr(db, "engine", test_engine, raising=False)
+    db.create_all()
+    with Session(test_engine) as session:
+        session.add(
+            db.PlayerRow(
+                player_id="BUF_QB_1",
+                name="Starter",
+                position=PositionEnum.QB,
+                jersey_number=12,
+                team_id="BUF",
+                attributes={"speed": 70, "awareness": 90},
+            )
+        )
+        session.add(
+            db.PlayerRow(player_id="MIA_K_1", name="Kicker", position=PositionEnum.K, jersey_number=3, team_id="MIA")
+        )
+        session.commit()
+    repo = RosterRepository(user_home=tmp_path)
+    repo._engine = test_engine
+
+    assert repo.list_players("BUF") == [
+        RosterPlayer(player_id="BUF_QB_1", name="Starter", position=PositionEnum.QB, jersey_number=12, overall=80)
+    ]
+
+
+def test_validate_reports_position_minimums_and_duplicate_slots(tmp_path: Path) -> None:
+    repo = RosterRepository(user_home=tmp_path)
+    players = repo._generate_fallback_players("BUF")
+    repo.save_roster("BUF", [player for player in players if player.position is not PositionEnum.K])
+    slots = [
+        DepthSlot(0, db.DepthUnitEnum.OFFENSE, "QB1", PositionEnum.QB, 0, "BUF_QB_0"),
+        DepthSlot(1, db.DepthUnitEnum.OFFENSE, "QB2", PositionEnum.QB, 1, "BUF_QB_0"),
+        DepthSlot(2, db.DepthUnitEnum.SPECIAL, "K", PositionEnum.K, 0, None),
+    ]
+
+    warnings = repo.validate("BUF", slots)
+
+    assert "Minimum requirement for K is 1. Currently 0." in warnings
+    assert "Some players are assigned to multiple depth slots." in warnings
+    assert not any(warning.startswith("Minimum requirement for QB") for warning in warnings)
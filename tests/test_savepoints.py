@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import os
+import shutil
+import sqlite3
+import tarfile
 import tempfile
+from contextlib import closing
 from pathlib import Path
 
+import pytest
+import zstandard as zstd
+
+from domain import savepoint
 from domain.savepoint import create_savepoint, load_savepoint
 from sim.schedule import simulate_season
 from domain.models import Attributes, Player
@@ -62,3 +71,104 @@ def test_savepoint_round_trip(tmp_path: Path) -> None:
         for g in simulate_season(teams, seed=42, workers=1).game_results
     ]
     assert rerun == baseline
+
+
+def test_savepoint_round_trips_sqlite_database(tmp_path: Path) -> None:
+    db_path = tmp_path / "gridiron.db"
+    with closing(sqlite3.connect(db_path)) as connection:
+        connection.execute("CREATE TABLE team (team_id TEXT PRIMARY KEY)")
+        connection.execute("INSERT INTO team VALUES ('BUF')")
+        connection.commit()
+    save_dir = tmp_path / "savepoints"
+    create_savepoint("week1", db_path=db_path, plays_path=None, save_dir=save_dir)
+
+    with closing(sqlite3.connect(db_path)) as live:
+        live.execute("INSERT INTO team VALUES ('MIA')")
+        live.commit()
+        load_savepoint("week1", db_path=db_path, plays_path=None, save_dir=save_dir)
+        assert live.execute("SELECT team_id FROM team").fetchall() == [("BUF",)]
+
+
+def test_savepoint_archive_round_trips_asset_trees(tmp_path: Path) -> None:
+    db_path = tmp_path / "gridiron.db"
+    db_path.write_text("initial", encoding="utf-8")
+    plays_dir = tmp_path / "plays"
+    (plays_dir / "archive").mkdir(parents=True)
+    payload = b"{\"play_id\": \"slant\"}" * 512
+    (plays_dir / "archive" / "slant.json").write_bytes(payload)
+    os.utime(plays_dir / "archive" / "slant.json", (1_600_000_000, 1_600_000_000))
+    notes = tmp_path / "notes.txt"
+    notes.write_text("scouting", encoding="utf-8")
+    save_dir = tmp_path / "saves"
+
+    target = create_savepoint(
+        "assets", db_path=db_path, plays_path=plays_dir, extra_paths=[notes], save_dir=save_dir
+    )
+
+    assert target == save_dir / "assets.tar.zst"
+    assert [child.name for child in save_dir.iterdir()] == ["assets.tar.zst"]
+    with target.open("rb") as raw, zstd.ZstdDecompressor().stream_reader(raw) as stream:
+        with tarfile.open(fileobj=stream, mode="r|") as archive:
+            names = [member.name for member in archive]
+    assert names[0] == "gridiron.db"
+    assert {"plays/archive/slant.json", "notes.txt", "metadata.json"} <= set(names)
+
+    shutil.rmtree(plays_dir)
+    load_savepoint("assets", db_path=db_path, plays_path=plays_dir, save_dir=save_dir)
+    restored = plays_dir / "archive" / "slant.json"
+    assert restored.read_bytes() == payload
+    assert restored.stat().st_mtime == 1_600_000_000
+
+
+def test_load_savepoint_reads_legacy_directories(tmp_path: Path) -> None:
+    source = tmp_path / "saves" / "legacy"
+    (source / "plays").mkdir(parents=True)
+    (source / "gridiron.db").write_text("legacy", encoding="utf-8")
+    (source / "plays" / "sample.json").write_text("{}", encoding="utf-8")
+    db_path = tmp_path / "gridiron.db"
+    plays_dir = tmp_path / "plays"
+
+    load_savepoint("legacy", db_path=db_path, plays_path=plays_dir, save_dir=tmp_path / "saves")
+
+    assert db_path.read_text(encoding="utf-8") == "legacy"
+    assert (plays_dir / "sample.json").exists()
+
+
+def test_load_savepoint_does_not_raw_copy_over_a_locked_database(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / "gridiron.db"
+    with closing(sqlite3.connect(db_path)) as connection:
+        connection.execute("CREATE TABLE team (team_id TEXT PRIMARY KEY)")
+        connection.commit()
+    save_dir = tmp_path / "savepoints"
+    create_savepoint("week1", db_path=db_path, plays_path=None, save_dir=save_dir)
+    before = db_path.read_bytes()
+
+    class _LockedConnection:
+        def backup(self, _target: object) -> None:
+            raise sqlite3.OperationalError("database is locked")
+
+        def close(self) -> None:
+            pass
+
+    monkeypatch.setattr(savepoint.sqlite3, "connect", lambda _path: _LockedConnection())
+    with pytest.raises(sqlite3.OperationalError):
+        load_savepoint("week1", db_path=db_path, plays_path=None, save_dir=save_dir)
+    assert db_path.read_bytes() == before
+
+
+def test_savepoint_member_check_rejects_escaping_paths() -> None:
+    import tarfile
+
+    from domain.savepoint import _is_plain_member
+
+    def member(name: str, kind: bytes = tarfile.REGTYPE) -> tarfile.TarInfo:
+        info = tarfile.TarInfo(name)
+        info.type = kind
+        info.mode = 0o4777
+        return info
+
+    plain = member("plays/a.json")
+    assert _is_plain_member(plain) and plain.mode == 0o755
+    assert not _is_plain_member(member("../gridiron.db"))
+    assert not _is_plain_member(member("/etc/passwd"))
+    assert not _is_plain_member(member("plays/link", tarfile.SYMTYPE))
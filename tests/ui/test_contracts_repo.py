@@ -23,3 +23,43 @@ def test_contract_repository_generates_and_updates(tmp_path: Path) -> None:
 
     restructure_summary = repo.auto_restructure("ATX")
     assert restructure_summary.cap_limit == CAP_LIMIT
+
+
+def test_contract_updates_persist_to_database(tmp_path: Path) -> None:
+    repo = ContractsRepository(tmp_path)
+    first = repo.list_contracts("BOS")[0]
+    repo.update_contract(replace(first, years=first.years + 1))
+
+    reloaded = ContractsRepository(tmp_path / "fresh").list_contracts("BOS")
+    match = next(c for c in reloaded if c.contract_id == first.contract_id)
+    assert match.years == first.years + 1
+
+
+def test_auto_restructure_stops_on_the_totals_it_returns(tmp_path: Path, monkeypatch) -> None:
+    repo = ContractsRepository(tmp_path)
+    template = repo.list_contracts("ATX")[0]
+    over_cap = [
+        replace(template, contract_id=f"C{idx}", base_salary=CAP_LIMIT / 9 + 0.1, signing_bonus=0.0, years=3)
+        for idx in range(10)
+    ]
+    monkeypatch.setattr(repo, "list_contracts", lambda team_id: list(over_cap))
+    monkeypatch.setattr(repo, "_persist_bulk", lambda team_id, contracts: None)
+
+    summary = repo.auto_restructure("ATX")
+
+    assert summary.cap_available >= 0
+    assert summary == repo._calculate_summary(repo._cache["ATX"])
+
+
+def test_contract_fallback_keeps_teams_saved_by_another_repository(tmp_path: Path) -> None:
+    import orjson
+
+    first = ContractsRepository(tmp_path)
+    second = ContractsRepository(tmp_path)
+    template = first.list_contracts("ATX")[0]
+
+    second._persist_bulk("T2", [replace(template, contract_id="T2-contract", team_id="T2")])
+    first._persist_bulk("T1", [replace(template, contract_id="T1-contract", team_id="T1")])
+
+    saved = orjson.loads((tmp_path / "settings" / "contracts.json").read_bytes())
+    assert {"T1", "T2"} <= set(saved)
@@ -32,6 +32,9 @@ class DummyTeamRepository:
     def list_teams(self) -> list[TeamInfo]:
         return list(self._teams)
 
+    def team_ids(self) -> tuple[str, ...]:
+        return tuple(team.team_id for team in self._teams)
+
     def find_team(self, team_id: str, *, fallbacks: bool = True) -> TeamInfo | None:  # noqa: ARG002
         for team in self._teams:
             if team.team_id == team_id: